@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+from core.profiler import profile_process, request_profiles
+from utils.dependencies import get_admin_user
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile_worker(
+    seconds: float = Query(10, gt=0, le=60),
+    interval_ms: float = Query(5, ge=1, le=1000),
+    current_user = Depends(get_admin_user)
+):
+    folded = await run_in_threadpool(profile_process, seconds, interval_ms / 1000)
+    if folded is None:
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    return PlainTextResponse(folded)
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_request_profile(
+    profile_id: str,
+    current_user = Depends(get_admin_user)
+):
+    folded = request_profiles.get(profile_id)
+    if folded is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(folded)
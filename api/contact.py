@@ -9,11 +9,11 @@ from utils.dependencies import get_admin_user
 router = APIRouter(prefix="/contact", tags=["Contact"])
 
 @router.get("/", response_model=List[ContactResponse])
-async def get_contacts(db: Session = Depends(get_db)):
+def get_contacts(db: Session = Depends(get_db)):
     return db.query(Contact).all()
 
 @router.post("/", response_model=ContactResponse)
-async def create_contact(
+def create_contact(
     contact_data: ContactCreate,
     db: Session = Depends(get_db),
     current_user = Depends(get_admin_user)
@@ -25,7 +25,7 @@ async def create_contact(
     return db_contact
 
 @router.put("/{contact_id}", response_model=ContactResponse)
-async def update_contact(
+def update_contact(
     contact_id: int,
     contact_data: ContactUpdate,
     db: Session = Depends(get_db),
@@ -44,7 +44,7 @@ async def update_contact(
     return db_contact
 
 @router.delete("/{contact_id}")
-async def delete_contact(
+def delete_contact(
     contact_id: int,
     db: Session = Depends(get_db),
     current_user = Depends(get_admin_user)
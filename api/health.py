@@ -0,0 +1,92 @@
+import asyncio
+import shutil
+import time
+from fastapi import APIRouter, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from core.config import settings
+from core.database import engine, replica_router
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+# Last readiness result, shared by all probes until it expires
+_ready_cache = {"expires_at": 0.0, "status_code": 503, "content": None}
+_ready_lock = asyncio.Lock()
+
+def check_database() -> dict:
+    started = time.perf_counter()
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    return {"status": "up", "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+
+def check_pool() -> dict:
+    pool = engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {"status": "ok"}
+    checked_out = pool.checkedout()
+    capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+    saturation = checked_out / capacity if capacity else 0.0
+    return {
+        "status": "saturated" if saturation >= settings.HEALTH_POOL_SATURATION else "ok",
+        "size": pool.size(),
+        "checked_out": checked_out,
+        "overflow": pool.overflow(),
+        "saturation": round(saturation, 2),
+    }
+
+def check_disk() -> dict:
+    usage = shutil.disk_usage(settings.UPLOAD_DIR)
+    free_mb = usage.free // (1024 * 1024)
+    return {
+        "status": "ok" if free_mb >= settings.HEALTH_MIN_FREE_DISK_MB else "low",
+        "free_mb": free_mb,
+    }
+
+async def run_checks() -> dict:
+    checks = {}
+    try:
+        checks["database"] = await asyncio.wait_for(
+            run_in_threadpool(check_database), settings.HEALTH_DB_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        checks["database"] = {"status": "timeout"}
+    except Exception as exc:
+        checks["database"] = {"status": "down", "error": exc.__class__.__name__}
+    checks["pool"] = check_pool()
+    try:
+        checks["disk"] = check_disk()
+    except OSError as exc:
+        checks["disk"] = {"status": "unavailable", "error": exc.__class__.__name__}
+    if replica_router.engines:
+        # Informational: reads fall back to the primary when replicas lag
+        checks["replicas"] = replica_router.status()
+    return checks
+
+@router.get("")
+async def health_check():
+    return {"status": "healthy"}
+
+@router.get("/live")
+async def liveness():
+    # The process is up and serving requests; dependencies are not checked
+    return {"status": "alive"}
+
+@router.get("/ready")
+async def readiness(request: Request):
+    if not getattr(request.app.state, "started", False):
+        return JSONResponse(status_code=503, content={"status": "starting"})
+
+    async with _ready_lock:
+        if _ready_cache["expires_at"] <= time.monotonic():
+            checks = await run_checks()
+            healthy = (
+                checks["database"]["status"] == "up"
+                and checks["pool"]["status"] == "ok"
+                and checks["disk"]["status"] == "ok"
+            )
+            _ready_cache["status_code"] = 200 if healthy else 503
+            _ready_cache["content"] = {"status": "ready" if healthy else "unavailable", "checks": checks}
+            _ready_cache["expires_at"] = time.monotonic() + settings.HEALTH_CACHE_SECONDS
+
+    return JSONResponse(status_code=_ready_cache["status_code"], content=_ready_cache["content"])
@@ -1,401 +1,125 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Response
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List
+from core.config import settings
 from core.database import get_db
 from models.regulatory import (
     ConstructionNorm, Standard, BuildingRegulation, 
-    CostResourceNorm, TechnicalRegulation, Reference
+    CostResourceNorm, CostResourceNormShnq, TechnicalRegulation, Reference
 )
 from schemas.regulatory import (
-    ConstructionNormResponse, ConstructionNormCreate, ConstructionNormUpdate,
-    StandardResponse, StandardCreate, StandardUpdate,
+    ConstructionNormResponse, ConstructionNormCreate, ConstructionNormUpdate, ConstructionNormTree,
+    StandardResponse, StandardCreate, StandardUpdate, StandardListItem,
     BuildingRegulationResponse, BuildingRegulationCreate, BuildingRegulationUpdate,
     CostResourceNormResponse, CostResourceNormCreate, CostResourceNormUpdate,
-    TechnicalRegulationResponse, TechnicalRegulationCreate, TechnicalRegulationUpdate,
-    ReferenceResponse, ReferenceCreate, ReferenceUpdate
+    TechnicalRegulationResponse, TechnicalRegulationCreate, TechnicalRegulationUpdate, TechnicalRegulationListItem,
+    ReferenceResponse, ReferenceCreate, ReferenceUpdate,
+    DocumentReferences, DocumentReferencedBy, DocumentDependencies, SuggestItem,
+    STANDARD_SUMMARY_FIELDS, TECHNICAL_REGULATION_SUMMARY_FIELDS
 )
 from schemas.common import PaginatedResponse, FileUploadResponse
-from utils.dependencies import get_admin_user
+from utils.crud import crud_routes, contains_filter
+from utils.dependencies import get_admin_user, cache_control, get_locale
 from utils.pagination import paginate
-from utils.file_handler import save_upload_file, delete_file
+from utils.file_handler import save_upload_file
+from utils.norm_tree import norm_tree
+from utils.reference_graph import reference_graph, KINDS
+from utils.suggest import suggest_index
 
 router = APIRouter(prefix="/regulatory", tags=["Regulatory Documents"])
 
-# Construction Norms endpoints
-@router.get("/construction-norms", response_model=PaginatedResponse[ConstructionNormResponse])
-async def get_construction_norms(
-    page: int = Query(1, ge=1),
-    size: int = Query(10, ge=1, le=100),
-    subsystem: Optional[str] = Query(None),
-    group: Optional[str] = Query(None),
+# Typeahead over codes, numbers and title words of every regulatory document
+@router.get("/suggest", response_model=List[SuggestItem], dependencies=[Depends(cache_control)])
+def suggest(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    locale: str = Depends(get_locale),
     db: Session = Depends(get_db)
 ):
-    query = db.query(ConstructionNorm)
-    if subsystem:
-        query = query.filter(ConstructionNorm.subsystem.ilike(f"%{subsystem}%"))
-    if group:
-        query = query.filter(ConstructionNorm.group.ilike(f"%{group}%"))
-    query = query.order_by(ConstructionNorm.subsystem, ConstructionNorm.group, ConstructionNorm.code)
-    return paginate(query, page, size)
-
-@router.post("/construction-norms", response_model=ConstructionNormResponse)
-async def create_construction_norm(
-    norm_data: ConstructionNormCreate,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_norm = ConstructionNorm(**norm_data.dict())
-    db.add(db_norm)
-    db.commit()
-    db.refresh(db_norm)
-    return db_norm
-
-@router.put("/construction-norms/{norm_id}", response_model=ConstructionNormResponse)
-async def update_construction_norm(
-    norm_id: int,
-    norm_data: ConstructionNormUpdate,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_norm = db.query(ConstructionNorm).filter(ConstructionNorm.id == norm_id).first()
-    if not db_norm:
-        raise HTTPException(status_code=404, detail="Construction norm not found")
-    
-    update_data = norm_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_norm, field, value)
-    
-    db.commit()
-    db.refresh(db_norm)
-    return db_norm
-
-@router.delete("/construction-norms/{norm_id}")
-async def delete_construction_norm(
-    norm_id: int,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_norm = db.query(ConstructionNorm).filter(ConstructionNorm.id == norm_id).first()
-    if not db_norm:
-        raise HTTPException(status_code=404, detail="Construction norm not found")
-    
-    db.delete(db_norm)
-    db.commit()
-    return {"message": "Construction norm deleted successfully"}
+    suggest_index.ensure_current(db)
+    return suggest_index.suggest(q, limit, locale)
 
-# Standards endpoints
-@router.get("/standards", response_model=PaginatedResponse[StandardResponse])
-async def get_standards(
-    page: int = Query(1, ge=1),
-    size: int = Query(10, ge=1, le=100),
-    search: Optional[str] = Query(None),
+# Declared before the construction norm routes so "tree" is not taken for an id
+@router.get("/construction-norms/tree", response_model=ConstructionNormTree)
+def get_construction_norm_tree(
+    include_norms: bool = Query(True),
+    locale: str = Depends(get_locale),
     db: Session = Depends(get_db)
 ):
-    query = db.query(Standard)
-    if search:
-        query = query.filter(
-            Standard.title.ilike(f"%{search}%") | 
-            Standard.code.ilike(f"%{search}%")
-        )
-    query = query.order_by(Standard.code)
-    return paginate(query, page, size)
-
-@router.post("/standards", response_model=StandardResponse)
-async def create_standard(
-    standard_data: StandardCreate,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_standard = Standard(**standard_data.dict())
-    db.add(db_standard)
-    db.commit()
-    db.refresh(db_standard)
-    return db_standard
-
-@router.put("/standards/{standard_id}", response_model=StandardResponse)
-async def update_standard(
-    standard_id: int,
-    standard_data: StandardUpdate,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_standard = db.query(Standard).filter(Standard.id == standard_id).first()
-    if not db_standard:
-        raise HTTPException(status_code=404, detail="Standard not found")
-    
-    update_data = standard_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_standard, field, value)
-    
-    db.commit()
-    db.refresh(db_standard)
-    return db_standard
-
-@router.delete("/standards/{standard_id}")
-async def delete_standard(
-    standard_id: int,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_standard = db.query(Standard).filter(Standard.id == standard_id).first()
-    if not db_standard:
-        raise HTTPException(status_code=404, detail="Standard not found")
-    
-    db.delete(db_standard)
-    db.commit()
-    return {"message": "Standard deleted successfully"}
-
-# Building Regulations endpoints
-@router.get("/building-regulations", response_model=PaginatedResponse[BuildingRegulationResponse])
-async def get_building_regulations(
-    page: int = Query(1, ge=1),
-    size: int = Query(10, ge=1, le=100),
-    search: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
-):
-    query = db.query(BuildingRegulation)
-    if search:
-        query = query.filter(
-            BuildingRegulation.title.ilike(f"%{search}%") | 
-            BuildingRegulation.code.ilike(f"%{search}%") |
-            BuildingRegulation.number.ilike(f"%{search}%")
-        )
-    query = query.order_by(BuildingRegulation.number)
-    return paginate(query, page, size)
-
-@router.post("/building-regulations", response_model=BuildingRegulationResponse)
-async def create_building_regulation(
-    regulation_data: BuildingRegulationCreate,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_regulation = BuildingRegulation(**regulation_data.dict())
-    db.add(db_regulation)
-    db.commit()
-    db.refresh(db_regulation)
-    return db_regulation
-
-@router.put("/building-regulations/{regulation_id}", response_model=BuildingRegulationResponse)
-async def update_building_regulation(
-    regulation_id: int,
-    regulation_data: BuildingRegulationUpdate,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_regulation = db.query(BuildingRegulation).filter(BuildingRegulation.id == regulation_id).first()
-    if not db_regulation:
-        raise HTTPException(status_code=404, detail="Building regulation not found")
-    
-    update_data = regulation_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_regulation, field, value)
-    
-    db.commit()
-    db.refresh(db_regulation)
-    return db_regulation
-
-@router.delete("/building-regulations/{regulation_id}")
-async def delete_building_regulation(
-    regulation_id: int,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_regulation = db.query(BuildingRegulation).filter(BuildingRegulation.id == regulation_id).first()
-    if not db_regulation:
-        raise HTTPException(status_code=404, detail="Building regulation not found")
-    
-    db.delete(db_regulation)
-    db.commit()
-    return {"message": "Building regulation deleted successfully"}
-
-# Cost Resource Norms endpoints
-@router.get("/cost-resource-norms", response_model=PaginatedResponse[CostResourceNormResponse])
-async def get_cost_resource_norms(
-    page: int = Query(1, ge=1),
-    size: int = Query(10, ge=1, le=100),
-    search: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
-):
-    query = db.query(CostResourceNorm)
-    if search:
-        query = query.filter(
-            CostResourceNorm.srn_title.ilike(f"%{search}%") |
-            CostResourceNorm.srn_code.ilike(f"%{search}%")
-        )
-    query = query.order_by(CostResourceNorm.srn_code)
-    return paginate(query, page, size)
-
-@router.post("/cost-resource-norms", response_model=CostResourceNormResponse)
-async def create_cost_resource_norm(
-    norm_data: CostResourceNormCreate,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_norm = CostResourceNorm(**norm_data.dict())
-    db.add(db_norm)
-    db.commit()
-    db.refresh(db_norm)
-    return db_norm
-
-@router.put("/cost-resource-norms/{norm_id}", response_model=CostResourceNormResponse)
-async def update_cost_resource_norm(
-    norm_id: int,
-    norm_data: CostResourceNormUpdate,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_norm = db.query(CostResourceNorm).filter(CostResourceNorm.id == norm_id).first()
-    if not db_norm:
-        raise HTTPException(status_code=404, detail="Cost resource norm not found")
-    
-    update_data = norm_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_norm, field, value)
-    
-    db.commit()
-    db.refresh(db_norm)
-    return db_norm
-
-@router.delete("/cost-resource-norms/{norm_id}")
-async def delete_cost_resource_norm(
-    norm_id: int,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_norm = db.query(CostResourceNorm).filter(CostResourceNorm.id == norm_id).first()
-    if not db_norm:
-        raise HTTPException(status_code=404, detail="Cost resource norm not found")
-    
-    if db_norm.file:
-        delete_file(db_norm.file)
-    
-    db.delete(db_norm)
-    db.commit()
-    return {"message": "Cost resource norm deleted successfully"}
-
-# Technical Regulations endpoints
-@router.get("/technical-regulations", response_model=PaginatedResponse[TechnicalRegulationResponse])
-async def get_technical_regulations(
-    page: int = Query(1, ge=1),
-    size: int = Query(10, ge=1, le=100),
-    search: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
-):
-    query = db.query(TechnicalRegulation)
-    if search:
-        query = query.filter(
-            TechnicalRegulation.title.ilike(f"%{search}%") |
-            TechnicalRegulation.code.ilike(f"%{search}%")
-        )
-    query = query.order_by(TechnicalRegulation.code)
-    return paginate(query, page, size)
+    norm_tree.ensure_current(db)
+    # Served pre-rendered; the tree only changes when norms do. A returned
+    # Response does not pick up the headers get_locale set
+    return Response(
+        content=norm_tree.render(include_norms, locale),
+        media_type="application/json",
+        headers={
+            "Cache-Control": f"public, max-age={settings.CACHE_MAX_AGE}",
+            "Content-Language": locale,
+            "Vary": "Accept-Language",
+        }
+    )
+
+crud_routes(
+    router, "/construction-norms", ConstructionNorm, name="Construction norm", slug="construction_norm",
+    response_schema=ConstructionNormResponse, create_schema=ConstructionNormCreate, update_schema=ConstructionNormUpdate,
+    filters={"subsystem": contains_filter(ConstructionNorm.subsystem), "group": contains_filter(ConstructionNorm.group)},
+    order_by=(ConstructionNorm.subsystem, ConstructionNorm.group, ConstructionNorm.code_sort_key, ConstructionNorm.code),
+    lookup="code"
+)
 
-@router.post("/technical-regulations", response_model=TechnicalRegulationResponse)
-async def create_technical_regulation(
-    regulation_data: TechnicalRegulationCreate,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_regulation = TechnicalRegulation(**regulation_data.dict())
-    db.add(db_regulation)
-    db.commit()
-    db.refresh(db_regulation)
-    return db_regulation
+crud_routes(
+    router, "/standards", Standard, name="Standard", slug="standard",
+    response_schema=StandardResponse, create_schema=StandardCreate, update_schema=StandardUpdate,
+    list_schema=StandardListItem, summary_fields=STANDARD_SUMMARY_FIELDS,
+    search=("title", "code"), order_by=(Standard.code_sort_key, Standard.code),
+    lookup="code"
+)
 
-@router.put("/technical-regulations/{regulation_id}", response_model=TechnicalRegulationResponse)
-async def update_technical_regulation(
-    regulation_id: int,
-    regulation_data: TechnicalRegulationUpdate,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_regulation = db.query(TechnicalRegulation).filter(TechnicalRegulation.id == regulation_id).first()
-    if not db_regulation:
-        raise HTTPException(status_code=404, detail="Technical regulation not found")
-    
-    update_data = regulation_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_regulation, field, value)
-    
-    db.commit()
-    db.refresh(db_regulation)
-    return db_regulation
+crud_routes(
+    router, "/building-regulations", BuildingRegulation, name="Building regulation", slug="building_regulation",
+    response_schema=BuildingRegulationResponse, create_schema=BuildingRegulationCreate, update_schema=BuildingRegulationUpdate,
+    search=("title", "code", "number"), order_by=(BuildingRegulation.number_sort_key, BuildingRegulation.number),
+    lookup="code"
+)
 
-@router.delete("/technical-regulations/{regulation_id}")
-async def delete_technical_regulation(
-    regulation_id: int,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_regulation = db.query(TechnicalRegulation).filter(TechnicalRegulation.id == regulation_id).first()
-    if not db_regulation:
-        raise HTTPException(status_code=404, detail="Technical regulation not found")
-    
-    db.delete(db_regulation)
-    db.commit()
-    return {"message": "Technical regulation deleted successfully"}
+crud_routes(
+    router, "/cost-resource-norms", CostResourceNorm, name="Cost resource norm", slug="cost_resource_norm",
+    response_schema=CostResourceNormResponse, create_schema=CostResourceNormCreate, update_schema=CostResourceNormUpdate,
+    search=("srn_title", "srn_code"), order_by=(CostResourceNorm.srn_code_sort_key, CostResourceNorm.srn_code),
+    lookup="srn_code"
+)
 
-# References endpoints
-@router.get("/references", response_model=PaginatedResponse[ReferenceResponse])
-async def get_references(
+@router.get("/cost-resource-norms/by-shnq/{shnq_code:path}", response_model=PaginatedResponse[CostResourceNormResponse])
+def get_cost_resource_norms_by_shnq(
+    shnq_code: str,
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
-    search: Optional[str] = Query(None),
+    main_only: bool = Query(False),
+    locale: str = Depends(get_locale),
     db: Session = Depends(get_db)
 ):
-    query = db.query(Reference)
-    if search:
-        query = query.filter(
-            Reference.title.ilike(f"%{search}%") |
-            Reference.number.ilike(f"%{search}%")
-        )
-    query = query.order_by(Reference.number)
-    return paginate(query, page, size)
-
-@router.post("/references", response_model=ReferenceResponse)
-async def create_reference(
-    reference_data: ReferenceCreate,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_reference = Reference(**reference_data.dict())
-    db.add(db_reference)
-    db.commit()
-    db.refresh(db_reference)
-    return db_reference
-
-@router.put("/references/{reference_id}", response_model=ReferenceResponse)
-async def update_reference(
-    reference_id: int,
-    reference_data: ReferenceUpdate,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_reference = db.query(Reference).filter(Reference.id == reference_id).first()
-    if not db_reference:
-        raise HTTPException(status_code=404, detail="Reference not found")
-    
-    update_data = reference_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_reference, field, value)
-    
-    db.commit()
-    db.refresh(db_reference)
-    return db_reference
+    # Seeks ix_cost_resource_norm_shnqs_shnq_code instead of scanning the JSON
+    query = db.query(CostResourceNorm).join(
+        CostResourceNormShnq, CostResourceNormShnq.cost_resource_norm_id == CostResourceNorm.id
+    ).filter(CostResourceNormShnq.shnq_code == shnq_code.strip())
+    if main_only:
+        query = query.filter(CostResourceNormShnq.is_main.is_(True))
+    query = query.order_by(CostResourceNorm.srn_code_sort_key, CostResourceNorm.srn_code)
+    return paginate(query, page, size, locale=locale)
+
+crud_routes(
+    router, "/technical-regulations", TechnicalRegulation, name="Technical regulation", slug="technical_regulation",
+    response_schema=TechnicalRegulationResponse, create_schema=TechnicalRegulationCreate, update_schema=TechnicalRegulationUpdate,
+    list_schema=TechnicalRegulationListItem, summary_fields=TECHNICAL_REGULATION_SUMMARY_FIELDS,
+    search=("title", "code"), order_by=(TechnicalRegulation.code_sort_key, TechnicalRegulation.code),
+    lookup="code"
+)
 
-@router.delete("/references/{reference_id}")
-async def delete_reference(
-    reference_id: int,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_admin_user)
-):
-    db_reference = db.query(Reference).filter(Reference.id == reference_id).first()
-    if not db_reference:
-        raise HTTPException(status_code=404, detail="Reference not found")
-    
-    db.delete(db_reference)
-    db.commit()
-    return {"message": "Reference deleted successfully"}
+crud_routes(
+    router, "/references", Reference, name="Reference", slug="reference",
+    response_schema=ReferenceResponse, create_schema=ReferenceCreate, update_schema=ReferenceUpdate,
+    search=("title", "number"), order_by=(Reference.number_sort_key, Reference.number)
+)
 
 # File upload for regulatory documents
 @router.post("/upload/document", response_model=FileUploadResponse)
@@ -408,4 +132,40 @@ async def upload_regulatory_document(
         filename=file.filename,
         url=f"/uploads/{file_path}",
         size=file.size or 0
-    )
\ No newline at end of file
+    )
+
+# Cross-reference graph endpoints; kind is a list endpoint path such as "standards"
+def get_graph_document(kind: str, doc_id: int, locale: str, db: Session):
+    if kind not in KINDS:
+        raise HTTPException(status_code=404, detail="Unknown document type")
+    reference_graph.ensure_current(db)
+    document = reference_graph.node(kind, doc_id, locale)
+    if not document:
+        raise HTTPException(status_code=404, detail="Document not found")
+    return document
+
+@router.get("/graph/{kind}/{doc_id}/references", response_model=DocumentReferences, response_model_exclude_none=True, dependencies=[Depends(cache_control)])
+def get_document_references(kind: str, doc_id: int, locale: str = Depends(get_locale), db: Session = Depends(get_db)):
+    document = get_graph_document(kind, doc_id, locale, db)
+    references, unresolved = reference_graph.references(kind, doc_id, locale)
+    return {"document": document, "references": references, "unresolved": unresolved}
+
+@router.get("/graph/{kind}/{doc_id}/referenced-by", response_model=DocumentReferencedBy, response_model_exclude_none=True, dependencies=[Depends(cache_control)])
+def get_document_referenced_by(kind: str, doc_id: int, locale: str = Depends(get_locale), db: Session = Depends(get_db)):
+    document = get_graph_document(kind, doc_id, locale, db)
+    return {"document": document, "referenced_by": reference_graph.referenced_by(kind, doc_id, locale)}
+
+@router.get("/graph/{kind}/{doc_id}/dependencies", response_model=DocumentDependencies, response_model_exclude_none=True, dependencies=[Depends(cache_control)])
+def get_document_dependencies(
+    kind: str,
+    doc_id: int,
+    direction: str = Query("references", pattern="^(references|referenced-by)$"),
+    max_depth: int = Query(10, ge=1, le=50),
+    locale: str = Depends(get_locale),
+    db: Session = Depends(get_db)
+):
+    document = get_graph_document(kind, doc_id, locale, db)
+    dependencies = reference_graph.dependencies(
+        kind, doc_id, reverse=direction == "referenced-by", max_depth=max_depth, locale=locale
+    )
+    return {"document": document, "direction": direction, "dependencies": dependencies}
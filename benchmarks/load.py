@@ -0,0 +1,148 @@
+"""Drive the main API endpoints at fixed concurrency and report latency.
+
+    DATABASE_URL=sqlite:///bench.db UPLOAD_DIR=/tmp/bench-uploads \
+        python -m benchmarks.load --concurrency 16 --requests 500 --save-baseline benchmarks/baseline.json
+
+    ... later, after a change:
+    python -m benchmarks.load --concurrency 16 --requests 500 --compare benchmarks/baseline.json
+
+Seed first with `python -m benchmarks.seed`. By default the app is driven
+in-process through ASGI; pass --base-url to hit a running server instead
+(uvicorn main:app --workers N), which also includes HTTP and worker overhead.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+import httpx
+from benchmarks.seed import ADMIN_EMAIL, ADMIN_PASSWORD
+
+API = "/api/v1"
+
+# name -> (method, path); uploads send a small generated file
+SCENARIOS = {
+    "news_list": ("GET", f"{API}/news/news"),
+    "news_list_page_20": ("GET", f"{API}/news/news?page=20&size=20"),
+    "news_detail": ("GET", f"{API}/news/news/1"),
+    "announcements_list": ("GET", f"{API}/news/announcements"),
+    "construction_norms": ("GET", f"{API}/regulatory/construction-norms?size=50"),
+    "construction_norms_filter": ("GET", f"{API}/regulatory/construction-norms?subsystem=1.&size=50"),
+    "standards": ("GET", f"{API}/regulatory/standards"),
+    "standards_search": ("GET", f"{API}/regulatory/standards?search=xavfsizlik"),
+    "building_regulations_search": ("GET", f"{API}/regulatory/building-regulations?search=ShNQ%202"),
+    "cost_resource_norms_search": ("GET", f"{API}/regulatory/cost-resource-norms?search=SRN"),
+    "technical_regulations": ("GET", f"{API}/regulatory/technical-regulations"),
+    "institute_about": ("GET", f"{API}/institute/about"),
+    "institute_management": ("GET", f"{API}/institute/management"),
+    "institute_vacancies": ("GET", f"{API}/institute/vacancies"),
+    "upload_image": ("UPLOAD", f"{API}/news/upload/image"),
+    "upload_document": ("UPLOAD", f"{API}/regulatory/upload/document"),
+}
+
+UPLOAD_BYTES = {
+    "image": (b"\x89PNG\r\n\x1a\n" + b"\0" * 64 * 1024, "bench.png", "image/png"),
+    "document": (b"%PDF-1.4\n" + b"0" * 512 * 1024, "bench.pdf", "application/pdf"),
+}
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(round(fraction * (len(sorted_values) - 1))), len(sorted_values) - 1)
+    return sorted_values[index]
+
+async def run_scenario(client: httpx.AsyncClient, name: str, total: int, concurrency: int, headers: Dict[str, str]) -> dict:
+    method, path = SCENARIOS[name]
+    latencies: List[float] = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            if method == "UPLOAD":
+                content, filename, content_type = UPLOAD_BYTES["image" if "image" in name else "document"]
+                response = await client.post(path, headers=headers, files={"file": (filename, content, content_type)})
+            else:
+                response = await client.request(method, path)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": total,
+        "errors": errors,
+        "rps": round(total / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2),
+    }
+
+def make_client(base_url: Optional[str]) -> httpx.AsyncClient:
+    if base_url:
+        return httpx.AsyncClient(base_url=base_url, timeout=60)
+    from main import app
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+
+async def run(args) -> Dict[str, dict]:
+    results = {}
+    async with make_client(args.base_url) as client:
+        login = await client.post(f"{API}/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+        login.raise_for_status()
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+        for name in args.scenarios or SCENARIOS:
+            # Warm up connections and caches before measuring
+            await run_scenario(client, name, min(args.concurrency * 2, args.requests), args.concurrency, headers)
+            results[name] = await run_scenario(client, name, args.requests, args.concurrency, headers)
+            result = results[name]
+            print(f"{name:<30} rps={result['rps']:>8}  p50={result['p50_ms']:>8}ms  "
+                  f"p95={result['p95_ms']:>8}ms  p99={result['p99_ms']:>8}ms  errors={result['errors']}")
+    return results
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> bool:
+    ok = True
+    print(f"\nComparison against baseline (tolerance {tolerance:.0%}):")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        p95_change = (result["p95_ms"] - base["p95_ms"]) / base["p95_ms"] if base["p95_ms"] else 0.0
+        rps_change = (result["rps"] - base["rps"]) / base["rps"] if base["rps"] else 0.0
+        regressed = p95_change > tolerance or rps_change < -tolerance
+        ok = ok and not regressed
+        print(f"{name:<30} p95 {p95_change:+7.1%}  rps {rps_change:+7.1%}  {'REGRESSION' if regressed else 'ok'}")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="API load benchmark")
+    parser.add_argument("--base-url", help="Benchmark a running server instead of the in-process app")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--scenario", dest="scenarios", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("--save-baseline", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Compare results with this baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative p95/RPS regression")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Microbenchmarks for CPU-heavy hot paths, evaluated in isolation.
+
+    python -m benchmarks.micro --save-baseline benchmarks/micro_baseline.json
+    python -m benchmarks.micro --compare benchmarks/micro_baseline.json --tolerance 0.2
+
+Covers PaginatedResponse construction from ORM rows, JWT creation and
+verification, paginate() against an in-memory SQLite table and
+save_upload_file() for several sizes. A benchmark whose median per-operation
+time grows beyond the tolerance fails the comparison (exit code 1).
+"""
+import argparse
+import asyncio
+import io
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+from fastapi import UploadFile
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from core.config import settings
+from core.database import Base
+from core.security import create_access_token, verify_token
+from models.news import News
+from schemas.common import PaginatedResponse
+from schemas.news import NewsResponse, NewsListItem, NEWS_SUMMARY_FIELDS
+from utils.file_handler import save_upload_file
+from utils.pagination import paginate
+
+def make_news(count: int):
+    now = datetime.utcnow()
+    return [
+        News(id=i, title=f"Yangilik {i}", content="Matn " * 400, image=f"news/images/{i}.jpg",
+             is_published=True, created_at=now - timedelta(minutes=i))
+        for i in range(count)
+    ]
+
+def make_session(rows: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all(make_news(rows))
+    session.commit()
+    return session
+
+def build_benchmarks(upload_dir: str) -> Dict[str, Callable[[], object]]:
+    news_page = make_news(20)
+    news_response = PaginatedResponse[NewsResponse]
+    list_response = PaginatedResponse[NewsListItem]
+    summary_rows = [{name: getattr(item, name) for name in NEWS_SUMMARY_FIELDS} for item in news_page]
+
+    token = create_access_token({"sub": "admin@tmsiti.uz"}, expires_delta=timedelta(minutes=30))
+
+    session = make_session(5000)
+    news_query = session.query(News).filter(News.is_published == True).order_by(News.created_at.desc())
+
+    settings.UPLOAD_DIR = upload_dir
+    loop = asyncio.new_event_loop()
+
+    def upload(size: int):
+        content = b"\0" * size
+        def run():
+            file = UploadFile(file=io.BytesIO(content), filename="bench.pdf", size=size)
+            return loop.run_until_complete(save_upload_file(file, "bench"))
+        return run
+
+    return {
+        "paginated_response_orm_20": lambda: news_response.model_validate(
+            {"items": news_page, "total": 5000, "page": 1, "size": 20, "pages": 250}, from_attributes=True
+        ),
+        "paginated_response_summary_20": lambda: list_response.model_validate(
+            {"items": summary_rows, "total": 5000, "page": 1, "size": 20, "pages": 250}
+        ),
+        "create_access_token": lambda: create_access_token({"sub": "admin@tmsiti.uz"}),
+        "verify_token": lambda: verify_token(token),
+        "paginate_page_1": lambda: paginate(news_query, 1, 20),
+        "paginate_page_100": lambda: paginate(news_query, 100, 20),
+        "paginate_page_1_projected": lambda: paginate(news_query, 1, 20, NEWS_SUMMARY_FIELDS),
+        "save_upload_file_1kb": upload(1024),
+        "save_upload_file_1mb": upload(1024 * 1024),
+        "save_upload_file_8mb": upload(8 * 1024 * 1024),
+    }
+
+def measure(func: Callable[[], object], repeat: int) -> dict:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    per_op = [total / number * 1e6 for total in timer.repeat(repeat=repeat, number=number)]
+    return {"median_us": round(statistics.median(per_op), 2), "best_us": round(min(per_op), 2), "loops": number}
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> bool:
+    ok = True
+    print(f"\nComparison against baseline (tolerance {tolerance:.0%}):")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        change = (result["median_us"] - base["median_us"]) / base["median_us"]
+        regressed = change > tolerance
+        ok = ok and not regressed
+        print(f"{name:<32} {change:+7.1%}  {'REGRESSION' if regressed else 'ok'}")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="Hot path microbenchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--benchmark", dest="benchmarks", action="append")
+    parser.add_argument("--save-baseline", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Compare results with this baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative slowdown of the median")
+    args = parser.parse_args()
+
+    upload_dir = tempfile.mkdtemp(prefix="tmsiti-bench-")
+    try:
+        benchmarks = build_benchmarks(upload_dir)
+        results = {}
+        for name in args.benchmarks or benchmarks:
+            results[name] = measure(benchmarks[name], args.repeat)
+            print(f"{name:<32} median={results[name]['median_us']:>12.2f}us  best={results[name]['best_us']:>12.2f}us")
+    finally:
+        shutil.rmtree(upload_dir, ignore_errors=True)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
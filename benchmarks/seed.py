@@ -0,0 +1,146 @@
+"""Seed a disposable database with realistic volumes of every model.
+
+    DATABASE_URL=sqlite:///bench.db python -m benchmarks.seed --scale 1
+
+Point DATABASE_URL at a local PostgreSQL (or SQLite as a stand-in). Tables
+are created directly from the models; never run this against a real database.
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from core.database import Base, SessionLocal, engine
+from core.security import get_password_hash
+from models.user import User
+from models.news import Announcement, News, Meeting, AntiCorruption
+from models.institute import About, Management, Structure, StructuralDivision, Vacancy
+from models.activities import ManagementSystem
+from models.regulatory import (
+    ConstructionNorm, Standard, BuildingRegulation,
+    CostResourceNorm, CostResourceNormShnq, TechnicalRegulation, Reference, shnq_links
+)
+from models.contact import Contact
+
+ADMIN_EMAIL = "bench@tmsiti.uz"
+ADMIN_PASSWORD = "bench-password"
+
+# Rows per model at --scale 1
+VOLUMES = {
+    News: 5000,
+    Announcement: 1000,
+    Meeting: 500,
+    AntiCorruption: 200,
+    Management: 30,
+    StructuralDivision: 40,
+    Vacancy: 300,
+    ManagementSystem: 200,
+    ConstructionNorm: 5000,
+    Standard: 3000,
+    BuildingRegulation: 2000,
+    CostResourceNorm: 2000,
+    TechnicalRegulation: 500,
+    Reference: 500,
+}
+
+WORDS = (
+    "qurilish norma standart talab loyiha bino inshoot xavfsizlik energiya samaradorlik "
+    "yong'in muhofaza zilzila seysmik issiqlik izolyatsiya suv ta'minoti kanalizatsiya "
+    "yo'l ko'prik tunnel material beton temir sinov nazorat sertifikat smeta resurs"
+).split()
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+def text(rng: random.Random, paragraphs: int) -> str:
+    return "\n\n".join(sentence(rng, 80) for _ in range(paragraphs))
+
+def shnq_code(index: int) -> str:
+    return f"ShNQ {index // 1000 + 1}.{index // 100 % 10:02d}.{index % 100:02d}-{2000 + index % 25}"
+
+def build_rows(model, counts: dict, rng: random.Random):
+    now = datetime.utcnow()
+    for i in range(counts[model]):
+        created = now - timedelta(minutes=i * 7)
+        if model is News:
+            yield dict(title=sentence(rng, 8), content=text(rng, 6), image=f"news/images/{i}.jpg",
+                       is_published=i % 10 != 0, created_at=created)
+        elif model is Announcement:
+            yield dict(title=sentence(rng, 8), content=text(rng, 3), is_active=i % 5 != 0, created_at=created)
+        elif model is Meeting:
+            yield dict(title=sentence(rng, 6), content=text(rng, 2), location=sentence(rng, 3),
+                       meeting_date=created if i % 4 else None, created_at=created)
+        elif model is AntiCorruption:
+            yield dict(title=sentence(rng, 6), content=text(rng, 2), created_at=created)
+        elif model is Management:
+            yield dict(full_name=sentence(rng, 3), position=sentence(rng, 3), order_index=i,
+                       specialization=sentence(rng, 20), created_at=created)
+        elif model is StructuralDivision:
+            yield dict(title=sentence(rng, 4), head_full_name=sentence(rng, 3), created_at=created)
+        elif model is Vacancy:
+            yield dict(title=sentence(rng, 5), description=text(rng, 2), requirements=text(rng, 1),
+                       contact_email="hr@tmsiti.uz", is_active=i % 3 != 0, created_at=created)
+        elif model is ManagementSystem:
+            yield dict(title=sentence(rng, 6), description=text(rng, 2), created_at=created)
+        elif model is ConstructionNorm:
+            yield dict(subsystem=f"{i % 10 + 1}. {sentence(rng, 3)}", group=f"{i % 50 + 1:02d}. {sentence(rng, 2)}",
+                       code=f"KMK {shnq_code(i)}", title=sentence(rng, 10), created_at=created)
+        elif model is Standard:
+            yield dict(code=f"O'z DSt {1000 + i}:{2000 + i % 25}", title=sentence(rng, 10),
+                       description=sentence(rng, 40), created_at=created)
+        elif model is BuildingRegulation:
+            yield dict(number=str(i + 1), code=shnq_code(i), title=sentence(rng, 10), created_at=created)
+        elif model is CostResourceNorm:
+            yield dict(srn_code=f"SRN {shnq_code(i)}", srn_title=sentence(rng, 8),
+                       main_shnq_code=shnq_code(rng.randrange(counts[BuildingRegulation])),
+                       main_shnq_title=sentence(rng, 6),
+                       additional_shnqs=[{"code": shnq_code(rng.randrange(counts[BuildingRegulation])),
+                                          "title": sentence(rng, 4)} for _ in range(rng.randrange(4))],
+                       created_at=created)
+        elif model is TechnicalRegulation:
+            yield dict(code=f"TR {i + 1}", title=sentence(rng, 10), description=sentence(rng, 40), created_at=created)
+        elif model is Reference:
+            yield dict(number=str(i + 1), title=sentence(rng, 10), created_at=created)
+
+def seed_shnq_links(db):
+    # Core inserts skip the ORM hook that keeps the link table in step
+    links = [
+        dict(link, cost_resource_norm_id=norm.id)
+        for norm in db.query(CostResourceNorm.id, CostResourceNorm.main_shnq_code,
+                             CostResourceNorm.main_shnq_title, CostResourceNorm.additional_shnqs)
+        for link in shnq_links(norm.main_shnq_code, norm.main_shnq_title, norm.additional_shnqs)
+    ]
+    db.execute(CostResourceNormShnq.__table__.insert(), links)
+
+def seed(scale: float, seed_value: int = 42):
+    rng = random.Random(seed_value)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        db.add(User(email=ADMIN_EMAIL, hashed_password=get_password_hash(ADMIN_PASSWORD),
+                    full_name="Benchmark Admin", is_admin=True, is_active=True))
+        db.add(About(content=text(rng, 10)))
+        db.add(Structure(title="Tuzilma", pdf_url="documents/structure.pdf"))
+        db.add(Contact(location="Toshkent", phone="+998 71 000 00 00", email="info@tmsiti.uz"))
+        counts = {model: max(int(count * scale), 1) for model, count in VOLUMES.items()}
+        for model in VOLUMES:
+            started = time.perf_counter()
+            rows = list(build_rows(model, counts, rng))
+            db.execute(model.__table__.insert(), rows)
+            if model is CostResourceNorm:
+                seed_shnq_links(db)
+            print(f"{model.__tablename__:<24} {len(rows):>7} rows  {time.perf_counter() - started:6.2f}s")
+        db.commit()
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed the benchmark database")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for the row counts in VOLUMES")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    seed(args.scale, args.seed)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import logging
+import queue
+import threading
+from datetime import datetime, timezone
+from typing import List
+from sqlalchemy import event, inspect
+from core.config import settings
+from core.database import SessionLocal, engine
+from core.logging import get_json_file_logger
+from models.audit import AuditLog
+
+logger = logging.getLogger(__name__)
+
+class AuditWriter:
+    """Writes audit records in batches from a background thread.
+
+    Request threads only enqueue; records are inserted into audit_log (or
+    appended to AUDIT_LOG_FILE) every AUDIT_FLUSH_INTERVAL_SECONDS or once
+    AUDIT_BATCH_SIZE records are waiting.
+    """
+
+    def __init__(self, max_queue: int = 10000):
+        self.queue = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def submit(self, records: List[dict]):
+        if not self.running:
+            return
+        for record in records:
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                logger.warning("Audit queue full, dropping record for %s %s", record["entity"], record["entity_id"])
+
+    def _next_batch(self) -> List[dict]:
+        batch = []
+        try:
+            batch.append(self.queue.get(timeout=settings.AUDIT_FLUSH_INTERVAL_SECONDS))
+        except queue.Empty:
+            return batch
+        while len(batch) < settings.AUDIT_BATCH_SIZE:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not self._stop.is_set() or not self.queue.empty():
+            batch = self._next_batch()
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch: List[dict]):
+        try:
+            if settings.AUDIT_LOG_BACKEND == "file":
+                file_logger = get_json_file_logger(
+                    "tmsiti.audit", settings.AUDIT_LOG_FILE,
+                    settings.LOG_FILE_MAX_BYTES, settings.LOG_FILE_BACKUPS
+                )
+                for record in batch:
+                    file_logger.info({"event": "audit", **record})
+            else:
+                with engine.begin() as connection:
+                    connection.execute(AuditLog.__table__.insert(), batch)
+        except Exception:
+            logger.exception("Failed to write %d audit records", len(batch))
+
+audit_writer = AuditWriter()
+
+def _entity_id(obj) -> str:
+    identity = inspect(obj).mapper.primary_key_from_instance(obj)
+    return ",".join(str(value) for value in identity)
+
+def _soft_deleted(state) -> bool:
+    # deleted_at set where it was NULL; an unloaded old value counts as NULL
+    if "deleted_at" not in state.mapper.column_attrs:
+        return False
+    history = state.attrs["deleted_at"].history
+    return any(value is not None for value in history.added) and all(value is None for value in history.deleted)
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_audit_records(session, flush_context):
+    """Queue a record per row the flush wrote.
+
+    Soft deletes are recorded as "delete" and the purger's hard deletes of
+    soft deleted rows as "purge". Core statements bypass the session and
+    go unrecorded: PublishingScheduler's publish/expire flag flips and
+    clear_references() nulling missing files.
+    """
+    user_id, user_email = session.info.get("audit_user", (None, None))
+    now = datetime.now(timezone.utc)
+    records = session.info.setdefault("audit_records", [])
+    for action, objects in (("create", session.new), ("update", session.dirty), ("delete", session.deleted)):
+        for obj in objects:
+            if isinstance(obj, AuditLog):
+                continue
+            state = inspect(obj)
+            recorded = action
+            if action == "update":
+                # Only field names are recorded, never values (e.g. password hashes)
+                changed = [attr.key for attr in state.attrs if attr.history.has_changes()]
+                if not changed:
+                    continue
+                if _soft_deleted(state):
+                    recorded = "delete"
+            elif action == "create":
+                changed = [attr.key for attr in state.mapper.column_attrs if state.dict.get(attr.key) is not None]
+            else:
+                changed = None
+                if state.dict.get("deleted_at") is not None:
+                    recorded = "purge"
+            records.append({
+                "user_id": user_id,
+                "user_email": user_email,
+                "action": recorded,
+                "entity": state.mapper.local_table.name,
+                "entity_id": _entity_id(obj),
+                "changed_fields": changed,
+                "created_at": now,
+            })
+
+@event.listens_for(SessionLocal, "after_commit")
+def _submit_audit_records(session):
+    records = session.info.pop("audit_records", None)
+    if records:
+        audit_writer.submit(records)
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_audit_records(session):
+    session.info.pop("audit_records", None)
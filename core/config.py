@@ -7,6 +7,59 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     UPLOAD_DIR: str
     MAX_FILE_SIZE: int
+    CACHE_MAX_AGE: int = 60
+    WARM_POOL_SIZE: int = 0
+    HEALTH_CACHE_SECONDS: float = 5.0
+    HEALTH_DB_TIMEOUT_SECONDS: float = 2.0
+    HEALTH_MIN_FREE_DISK_MB: int = 100
+    HEALTH_POOL_SATURATION: float = 0.9
+    QUERY_BUDGET: int = 10
+    N_PLUS_ONE_THRESHOLD: int = 5
+    SLOW_QUERY_THRESHOLD_MS: float = 500.0
+    SLOW_QUERY_LOG_FILE: str = "logs/slow_queries.log"
+    SLOW_QUERY_EXPLAIN: bool = False
+    SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS: float = 300.0
+    PROFILE_REQUESTS_ENABLED: bool = False
+    PROFILE_SAMPLE_INTERVAL_MS: float = 1.0
+    LOG_LEVEL: str = "INFO"
+    LOG_FILE_MAX_BYTES: int = 10485760
+    LOG_FILE_BACKUPS: int = 5
+    ACCESS_LOG_ENABLED: bool = True
+    AUDIT_LOG_BACKEND: str = "database"
+    AUDIT_LOG_FILE: str = "logs/audit.log"
+    AUDIT_BATCH_SIZE: int = 100
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    READ_REQUEST_TIMEOUT_SECONDS: float = 10.0
+    WRITE_REQUEST_TIMEOUT_SECONDS: float = 30.0
+    UPLOAD_REQUEST_TIMEOUT_SECONDS: float = 120.0
+    READ_STATEMENT_TIMEOUT_MS: int = 5000
+    WRITE_STATEMENT_TIMEOUT_MS: int = 15000
+    READ_CONCURRENCY_LIMIT: int = 64
+    WRITE_CONCURRENCY_LIMIT: int = 8
+    UPLOAD_CONCURRENCY_LIMIT: int = 4
+    READ_QUEUE_SIZE: int = 128
+    WRITE_QUEUE_SIZE: int = 16
+    UPLOAD_QUEUE_SIZE: int = 8
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 5.0
+    REPLICA_CONNECT_TIMEOUT_SECONDS: int = 2
+    READ_AFTER_WRITE_SECONDS: float = 10.0
+    MEMORY_INDEX_CHECK_SECONDS: float = 5.0
+    MEMORY_INDEX_REBUILD_SECONDS: float = 300.0
+    WARM_MEMORY_INDEXES: bool = False
+    PUBLISHING_SCHEDULER_ENABLED: bool = True
+    PUBLISHING_CHECK_INTERVAL_SECONDS: float = 60.0
+    PURGER_ENABLED: bool = True
+    SOFT_DELETE_RETENTION_DAYS: int = 30
+    SOFT_DELETE_PURGE_INTERVAL_SECONDS: float = 3600.0
+    SOFT_DELETE_PURGE_BATCH_SIZE: int = 500
+    FILE_SWEEP_INTERVAL_SECONDS: float = 86400.0
+    FILE_SWEEP_MIN_AGE_SECONDS: float = 86400.0
+    FILE_SWEEP_REMOVE: bool = False
+    UPLOAD_SCAN_WORKERS: int = 8
 
     class Config:
         env_file = ".env"
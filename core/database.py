@@ -1,16 +1,214 @@
-from sqlalchemy import create_engine
+import itertools
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+from fastapi import Request, Response
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from core.config import settings
+from core.slow_query import log_slow_query
 
-engine = create_engine(settings.DATABASE_URL)
+logger = logging.getLogger(__name__)
+
+# No connection is opened until the first query
+engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+LAST_WRITE_COOKIE = "tmsiti_last_write"
+
+# Lag is 0 when the replica has replayed everything it received, so an idle
+# primary does not make a caught-up replica look stale
+REPLICA_LAG_SQL = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+def _replica_connect_args(url: str) -> dict:
+    # An unreachable replica must fail fast instead of hanging on TCP connect
+    if make_url(url).get_backend_name() == "postgresql":
+        return {"connect_timeout": settings.REPLICA_CONNECT_TIMEOUT_SECONDS}
+    return {}
+
+class ReplicaRouter:
+    """Round-robins reads over replicas whose replication lag is acceptable.
+
+    Lag is measured off the request path by a background thread every
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS; until a replica has been measured,
+    and while it cannot be reached, its reads go to the primary.
+    """
+
+    def __init__(self, urls: List[str]):
+        self.engines = [
+            create_engine(url, pool_pre_ping=True, connect_args=_replica_connect_args(url)) for url in urls
+        ]
+        self._lag: Dict[int, Optional[float]] = {}
+        self._counter = itertools.count()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running or not self.engines:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="replica-lag", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Replica lag check failed")
+            self._stop.wait(settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS)
+
+    def _measure_lag(self, replica) -> Optional[float]:
+        try:
+            with replica.connect() as connection:
+                if connection.dialect.name != "postgresql":
+                    return 0.0
+                return float(connection.execute(text(REPLICA_LAG_SQL)).scalar() or 0.0)
+        except Exception:
+            return None
+
+    def refresh(self):
+        # Swapped in whole, so pick() never needs a lock
+        self._lag = {index: self._measure_lag(replica) for index, replica in enumerate(self.engines)}
+
+    def pick(self):
+        """A replica engine for reads, or None to use the primary."""
+        lag = self._lag
+        usable = [
+            replica for index, replica in enumerate(self.engines)
+            if lag.get(index) is not None and lag[index] <= settings.REPLICA_MAX_LAG_SECONDS
+        ]
+        if not usable:
+            return None
+        return usable[next(self._counter) % len(usable)]
+
+    def status(self) -> List[dict]:
+        return [
+            {"host": replica.url.host, "lag_seconds": self._lag.get(index)}
+            for index, replica in enumerate(self.engines)
+        ]
+
+replica_router = ReplicaRouter([url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()])
+
+class QueryStats:
+    """Statements issued while serving one request."""
+
+    def __init__(self, scope: Optional[dict] = None):
+        self.scope = scope
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Dict[str, int] = {}
+
+    def record(self, statement: str, duration: float):
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def repeated_statements(self, threshold: int) -> Dict[str, int]:
+        return {statement: count for statement, count in self.statements.items() if count >= threshold}
+
+# Set by QueryStatsMiddleware for the duration of a request
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+# Set by TimeoutMiddleware; applied to every transaction opened by get_db sessions
+current_statement_timeout: ContextVar[Optional[int]] = ContextVar("current_statement_timeout", default=None)
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_start_time"].pop()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+    if duration * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+        log_slow_query(conn, statement, parameters, duration, stats.scope if stats else None)
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start_time"):
+        connection.info["query_start_time"].pop()
+
+@event.listens_for(SessionLocal, "after_begin")
+def _apply_statement_timeout(session, transaction, connection):
+    timeout_ms = session.info.get("statement_timeout_ms")
+    if timeout_ms and connection.dialect.name == "postgresql":
+        # LOCAL so the setting ends with the transaction and never leaks to
+        # the next user of the pooled connection
+        connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+
+def is_statement_timeout(exc: Exception) -> bool:
+    orig = getattr(exc, "orig", None)
+    # 57014 = query_canceled (psycopg2 exposes pgcode, psycopg 3 sqlstate)
+    return getattr(orig, "pgcode", None) == "57014" or getattr(orig, "sqlstate", None) == "57014"
+
+def _wrote_recently(request: Request) -> bool:
+    try:
+        last_write = float(request.cookies.get(LAST_WRITE_COOKIE, 0))
+    except ValueError:
+        return False
+    return time.time() - last_write < settings.READ_AFTER_WRITE_SECONDS
+
+def get_db(request: Request, response: Response):
+    # Reads go to a replica unless this client wrote recently, so it always
+    # sees its own writes; everything else goes to the primary
+    bind = None
+    if request.method in READ_METHODS:
+        if not _wrote_recently(request):
+            bind = replica_router.pick()
+    db = SessionLocal(bind=bind) if bind is not None else SessionLocal()
+    db.info["statement_timeout_ms"] = current_statement_timeout.get()
+    if request.method not in READ_METHODS and replica_router.engines:
+        # The last-write cookie is only set once a write commits
+        db.info["write_response"] = response
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+@event.listens_for(SessionLocal, "after_commit")
+def _mark_last_write(session):
+    response = session.info.get("write_response")
+    if response is not None:
+        response.set_cookie(
+            LAST_WRITE_COOKIE, str(time.time()),
+            max_age=int(settings.READ_AFTER_WRITE_SECONDS) + 1, httponly=True, samesite="lax"
+        )
+
+def warm_pool(size: int):
+    # Open `size` connections up front so the first requests don't pay for them.
+    # Capped at the pool size: overflow connections are discarded on close
+    for target in [engine] + replica_router.engines:
+        connections = []
+        try:
+            for _ in range(min(size, target.pool.size())):
+                connections.append(target.connect())
+        finally:
+            for connection in connections:
+                connection.close()
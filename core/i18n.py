@@ -0,0 +1,69 @@
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy import Index, func, inspect, or_
+
+LOCALES = ("uz", "ru", "en")
+DEFAULT_LOCALE = "uz"
+TRANSLATION_LOCALES = tuple(locale for locale in LOCALES if locale != DEFAULT_LOCALE)
+
+# Models list their translated fields in __translated__; the base column
+# holds the default locale and nullable <field>_<locale> columns the others
+
+def trigram_indexes(table: str, field: str) -> List[Index]:
+    # For ILIKE '%...%' search in every locale; PostgreSQL with pg_trgm only
+    return [
+        Index(f"ix_{table}_{name}_trgm", name, postgresql_using="gin", postgresql_ops={name: "gin_trgm_ops"})
+        .ddl_if(dialect="postgresql")
+        for name in [field] + [f"{field}_{locale}" for locale in TRANSLATION_LOCALES]
+    ]
+
+def translation_column_names(model) -> List[str]:
+    return [f"{field}_{locale}" for field in getattr(model, "__translated__", ()) for locale in TRANSLATION_LOCALES]
+
+def base_column_names(model) -> List[str]:
+    hidden = set(translation_column_names(model))
+    return [name for name in inspect(model).column_attrs.keys() if name not in hidden]
+
+def is_translated(model) -> bool:
+    return bool(getattr(model, "__translated__", ()))
+
+def localized_column(model, name: str, locale: str):
+    """`name` in `locale`, falling back to the default locale where untranslated."""
+    column = getattr(model, name)
+    if locale == DEFAULT_LOCALE or name not in getattr(model, "__translated__", ()):
+        return column
+    return func.coalesce(getattr(model, f"{name}_{locale}"), column).label(name)
+
+def localized_columns(model, locale: str, names: Optional[Sequence[str]] = None) -> list:
+    return [localized_column(model, name, locale) for name in (names or base_column_names(model))]
+
+def localized_values(model, row: dict, name: str) -> Dict[str, Optional[str]]:
+    """`name` of a row dict in every locale, with localized_column's fallback."""
+    base = row.get(name)
+    values = {locale: base for locale in LOCALES}
+    if name in getattr(model, "__translated__", ()):
+        for locale in TRANSLATION_LOCALES:
+            if row.get(f"{name}_{locale}") is not None:
+                values[locale] = row[f"{name}_{locale}"]
+    return values
+
+def localized_search(model, name: str, locale: str, pattern: str):
+    condition = getattr(model, name).ilike(pattern)
+    if locale == DEFAULT_LOCALE or name not in getattr(model, "__translated__", ()):
+        return condition
+    return or_(getattr(model, f"{name}_{locale}").ilike(pattern), condition)
+
+def negotiate_locale(accept_language: Optional[str]) -> str:
+    """Best supported locale from an Accept-Language header."""
+    best, best_quality = DEFAULT_LOCALE, 0.0
+    for item in (accept_language or "").split(","):
+        tag, _, params = item.strip().partition(";")
+        language = tag.strip().lower().split("-")[0]
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                continue
+        if language in LOCALES and quality > best_quality:
+            best, best_quality = language, quality
+    return best
@@ -0,0 +1,96 @@
+import copy
+import json
+import logging
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Tuple
+from core.config import settings
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; dict messages are merged into the record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        if isinstance(record.msg, dict):
+            payload.update(record.msg)
+        else:
+            payload["message"] = record.getMessage()
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+class StructuredQueueHandler(QueueHandler):
+    """QueueHandler that keeps dict messages intact for JsonFormatter.
+
+    The stock handler formats the record into a string before queueing it.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+# Every queue handler installed, with its logger and listener, so
+# stop_logging() can detach them and a later setup starts afresh
+_installed: List[Tuple[logging.Logger, QueueHandler, QueueListener]] = []
+_stopped = False
+
+def queue_handler(logger: logging.Logger, *handlers: logging.Handler) -> QueueHandler:
+    # Request threads only enqueue records; a listener thread does the I/O
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    handler = StructuredQueueHandler(log_queue)
+    logger.addHandler(handler)
+    _installed.append((logger, handler, listener))
+    return handler
+
+def setup_logging():
+    global _stopped
+    _stopped = False
+    root = logging.getLogger()
+    if any(isinstance(handler, QueueHandler) for handler in root.handlers):
+        return
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter())
+    queue_handler(root, stream)
+    root.setLevel(settings.LOG_LEVEL)
+
+def stop_logging():
+    global _stopped
+    _stopped = True
+    # Detach first so nothing is queued behind a stopped listener, then
+    # flush whatever is still queued
+    for logger, handler, listener in _installed:
+        logger.removeHandler(handler)
+    for logger, handler, listener in _installed:
+        listener.stop()
+        for target in listener.handlers:
+            target.close()
+    _installed.clear()
+
+def get_json_file_logger(name: str, path: str, max_bytes: int, backup_count: int) -> logging.Logger:
+    logger = logging.getLogger(name)
+    # After stop_logging() records go to logging.lastResort rather than
+    # a queue no listener drains
+    if not logger.handlers and not _stopped:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        handler.setFormatter(JsonFormatter())
+        queue_handler(logger, handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
@@ -0,0 +1,166 @@
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from sqlalchemy import event, func, inspect
+from core.config import settings
+from core.database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+_indexes: List["MemoryIndex"] = []
+
+class MemoryIndex(ABC):
+    """In-process view over some tables, kept current incrementally on writes.
+
+    Commits made through this process are applied row by row after they
+    commit. Writes from other workers are picked up by comparing a cheap
+    per-table fingerprint at most every MEMORY_INDEX_CHECK_SECONDS, and a
+    full rebuild every MEMORY_INDEX_REBUILD_SECONDS covers anything missed.
+    """
+
+    models: Tuple = ()
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._fingerprint = None
+        self._rebaseline = False
+        self._checked_at = float("-inf")
+        self._built_at = float("-inf")
+        _indexes.append(self)
+
+    @abstractmethod
+    def rebuild(self, db):
+        """Reload everything from the database."""
+
+    @abstractmethod
+    def apply(self, action: str, model, row: Optional[dict], old: Optional[dict]):
+        """Apply one committed change; `row` is None for deletes, `old` None for creates."""
+
+    def fingerprint(self, db):
+        # Inserts move max(id), deletes move count, updates move max(updated_at)
+        return tuple(
+            tuple(db.query(func.count(model.id), func.max(model.id), func.max(model.updated_at)).one())
+            for model in self.models
+        )
+
+    def ensure_current(self, db):
+        if self._loaded and time.monotonic() - self._checked_at < settings.MEMORY_INDEX_CHECK_SECONDS:
+            return
+        with self._lock:
+            if self._loaded and time.monotonic() - self._checked_at < settings.MEMORY_INDEX_CHECK_SECONDS:
+                return
+            fingerprint = self.fingerprint(db)
+            stale = time.monotonic() - self._built_at >= settings.MEMORY_INDEX_REBUILD_SECONDS
+            # After local changes the fingerprint moved because of us; take the
+            # new one as the baseline instead of rebuilding
+            if not self._loaded or stale or (fingerprint != self._fingerprint and not self._rebaseline):
+                self.rebuild(db)
+                self._loaded = True
+                self._built_at = time.monotonic()
+            self._fingerprint = fingerprint
+            self._rebaseline = False
+            self._checked_at = time.monotonic()
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded = False
+
+    def _apply_changes(self, changes):
+        relevant = [change for change in changes if change[1] in self.models]
+        if not relevant:
+            return
+        with self._lock:
+            if not self._loaded:
+                return
+            try:
+                for action, model, row, old in relevant:
+                    self.apply(action, model, row, old)
+            except Exception:
+                logger.exception("Could not apply changes to %s; rebuilding", type(self).__name__)
+                self._loaded = False
+                return
+            # Re-baseline on the next read, keeping the window in which a
+            # concurrent remote write could be mistaken for ours short
+            self._rebaseline = True
+            self._checked_at = float("-inf")
+
+def warm_indexes():
+    db = SessionLocal()
+    try:
+        for index in _indexes:
+            index.ensure_current(db)
+    finally:
+        db.close()
+
+def invalidate_indexes(models=None):
+    """Force a rebuild on next use, e.g. after writes that bypassed the ORM."""
+    for index in _indexes:
+        if models is None or set(index.models) & set(models):
+            index.invalidate()
+
+def _watched_models():
+    return {model for index in _indexes for model in index.models}
+
+def _row(state) -> dict:
+    return {attr.key: state.dict.get(attr.key) for attr in state.mapper.column_attrs}
+
+def _old_row(state) -> dict:
+    row = {}
+    for attr in state.mapper.column_attrs:
+        history = state.attrs[attr.key].history
+        if history.deleted:
+            row[attr.key] = history.deleted[0]
+        elif history.unchanged:
+            row[attr.key] = history.unchanged[0]
+        else:
+            row[attr.key] = state.dict.get(attr.key)
+    return row
+
+@event.listens_for(SessionLocal, "before_flush")
+def _remember_old_rows(session, flush_context, instances):
+    # Pre-flush values are gone by after_flush, and an index needs them to
+    # move a row out of its old position
+    watched = _watched_models()
+    old_rows = session.info.setdefault("memory_index_old_rows", {})
+    for obj in list(session.dirty) + list(session.deleted):
+        if type(obj) in watched:
+            old_rows.setdefault(id(obj), _old_row(inspect(obj)))
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_changes(session, flush_context):
+    watched = _watched_models()
+    old_rows = session.info.pop("memory_index_old_rows", {})
+    changes = session.info.setdefault("memory_index_changes", [])
+    for action, objects in (("create", session.new), ("update", session.dirty), ("delete", session.deleted)):
+        for obj in objects:
+            if type(obj) not in watched:
+                continue
+            state = inspect(obj)
+            if action == "update" and not session.is_modified(obj, include_collections=False):
+                continue
+            # Plain column values only, so nothing is lazy loaded after commit
+            row = None if action == "delete" else _row(state)
+            old = None if action == "create" else old_rows.get(id(obj)) or _row(state)
+            # Soft deleted rows are out of every index
+            if row is not None and row.get("deleted_at") is not None:
+                row, action = None, "delete"
+            if old is not None and old.get("deleted_at") is not None:
+                old, action = None, "create"
+            if row is None and old is None:
+                continue
+            changes.append((action, type(obj), row, old))
+
+@event.listens_for(SessionLocal, "after_commit")
+def _apply_changes(session):
+    changes = session.info.pop("memory_index_changes", None)
+    if changes:
+        for index in _indexes:
+            index._apply_changes(changes)
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_changes(session):
+    session.info.pop("memory_index_changes", None)
+    session.info.pop("memory_index_old_rows", None)
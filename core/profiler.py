@@ -0,0 +1,110 @@
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from typing import Iterable, Optional
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Name of the threads FastAPI runs plain `def` handlers and dependencies in
+WORKER_THREAD_NAME = "AnyIO worker thread"
+
+def _runs_app_code(frame) -> bool:
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(APP_ROOT) and "site-packages" not in filename:
+            return True
+        frame = frame.f_back
+    return False
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+def _collapse(frame) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+class Sampler:
+    """Samples Python stacks from a background thread.
+
+    The result is in collapsed ("folded") format, one `frame;frame;frame count`
+    line per unique stack, which flamegraph.pl and speedscope read directly.
+    With `workers`, threadpool threads are sampled too while they run
+    application code (idle workers are skipped).
+    """
+
+    def __init__(self, interval: float = 0.005, thread_ids: Optional[Iterable[int]] = None, workers: bool = False):
+        self.interval = interval
+        self.thread_ids = set(thread_ids) if thread_ids is not None else None
+        self.workers = workers
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            workers = set()
+            if self.workers:
+                workers = {thread.ident for thread in threading.enumerate() if thread.name == WORKER_THREAD_NAME}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if self.thread_ids is not None and thread_id not in self.thread_ids:
+                    if thread_id not in workers or not _runs_app_code(frame):
+                        continue
+                self.stacks[_collapse(frame)] += 1
+            self.samples += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def folded(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+_profile_lock = threading.Lock()
+
+def profile_process(seconds: float, interval: float) -> Optional[str]:
+    """Sample every thread for `seconds`; None if a profile is already running."""
+    if not _profile_lock.acquire(blocking=False):
+        return None
+    try:
+        sampler = Sampler(interval)
+        sampler.start()
+        time.sleep(seconds)
+        sampler.stop()
+        return sampler.folded()
+    finally:
+        _profile_lock.release()
+
+class ProfileStore:
+    """Keeps the most recent per-request profiles for retrieval by id."""
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, folded: str) -> str:
+        profile_id = uuid.uuid4().hex
+        with self._lock:
+            self._items[profile_id] = folded
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return profile_id
+
+    def get(self, profile_id: str) -> Optional[str]:
+        with self._lock:
+            return self._items.get(profile_id)
+
+request_profiles = ProfileStore(max_items=50)
@@ -0,0 +1,149 @@
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import event, func, inspect, or_, select, update
+from core.config import settings
+from core.database import SessionLocal, engine
+from core.memory_index import invalidate_indexes
+from models.institute import Vacancy
+from models.news import Announcement, News
+
+logger = logging.getLogger(__name__)
+
+# Models with publish_at/expire_at; __visibility_flag__ names the boolean
+# that list endpoints filter on
+PUBLISHABLE = (News, Announcement, Vacancy)
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Naive values (and everything SQLite returns) are taken as UTC
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def visible(model, now: Optional[datetime] = None):
+    """List filter: flag set and not past expire_at, exact between scheduler runs."""
+    now = now or datetime.now(timezone.utc)
+    flag = getattr(model, model.__visibility_flag__)
+    return (flag == True) & or_(model.expire_at.is_(None), model.expire_at > now)
+
+class PublishingScheduler:
+    """Flips visibility flags when publish_at/expire_at come due.
+
+    Sleeps until the earliest pending publish_at/expire_at (found through
+    their partial indexes), at most PUBLISHING_CHECK_INTERVAL_SECONDS, and
+    is woken early by commits that touch a publishable model.
+    """
+
+    def __init__(self):
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="publishing-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+    def wake(self):
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                next_due = self.run_once()
+            except Exception:
+                logger.exception("Publishing scheduler run failed")
+                next_due = None
+            timeout = settings.PUBLISHING_CHECK_INTERVAL_SECONDS
+            if next_due is not None:
+                timeout = min(timeout, max((next_due - datetime.now(timezone.utc)).total_seconds(), 0.0))
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def run_once(self) -> Optional[datetime]:
+        """Apply everything due now; returns when the next change is due."""
+        now = datetime.now(timezone.utc)
+        changed, upcoming = [], []
+        with engine.begin() as connection:
+            for model in PUBLISHABLE:
+                table = model.__table__
+                flag = table.c[model.__visibility_flag__]
+                published = connection.execute(
+                    update(table)
+                    .where(flag == False, table.c.publish_at <= now)
+                    .where(or_(table.c.expire_at.is_(None), table.c.expire_at > now))
+                    .values({flag: True})
+                ).rowcount
+                expired = connection.execute(
+                    update(table).where(flag == True, table.c.expire_at <= now).values({flag: False})
+                ).rowcount
+                if published or expired:
+                    changed.append(model)
+                    logger.info("%s: published %d, expired %d", table.name, published, expired)
+                upcoming.append(connection.execute(
+                    select(func.min(table.c.publish_at)).where(flag == False, table.c.publish_at > now)
+                ).scalar())
+                upcoming.append(connection.execute(
+                    select(func.min(table.c.expire_at)).where(flag == True, table.c.expire_at > now)
+                ).scalar())
+        if changed:
+            # These UPDATEs bypass the session events in-process views rely on
+            invalidate_indexes(changed)
+        upcoming = [_utc(value) for value in upcoming if value is not None]
+        return min(upcoming) if upcoming else None
+
+publishing_scheduler = PublishingScheduler()
+
+def _apply_schedule(mapper, connection, target):
+    flag = mapper.class_.__visibility_flag__
+    state = inspect(target)
+    # Hidden by hand: a past publish_at must not let the scheduler undo that
+    hidden = (
+        not state.pending and state.attrs[flag].history.has_changes()
+        and not state.attrs["publish_at"].history.has_changes()
+    )
+    target.publish_at = _utc(target.publish_at)
+    target.expire_at = _utc(target.expire_at)
+    now = datetime.now(timezone.utc)
+    if target.publish_at is not None and target.publish_at > now:
+        # Scheduled: hidden until the scheduler publishes it
+        setattr(target, flag, False)
+    elif target.expire_at is not None and target.expire_at <= now:
+        setattr(target, flag, False)
+    elif hidden and getattr(target, flag) is False:
+        target.publish_at = None
+
+for _model in PUBLISHABLE:
+    event.listen(_model, "before_insert", _apply_schedule)
+    event.listen(_model, "before_update", _apply_schedule)
+
+@event.listens_for(SessionLocal, "after_flush")
+def _note_publishable_changes(session, flush_context):
+    if any(isinstance(obj, PUBLISHABLE) for obj in list(session.new) + list(session.dirty)):
+        session.info["publishing_changed"] = True
+
+@event.listens_for(SessionLocal, "after_commit")
+def _wake_scheduler(session):
+    if session.info.pop("publishing_changed", False):
+        publishing_scheduler.wake()
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_publishable_changes(session):
+    session.info.pop("publishing_changed", None)
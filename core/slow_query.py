@@ -0,0 +1,83 @@
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+from core.config import settings
+from core.logging import get_json_file_logger
+from core.metrics import route_template
+
+# EXPLAIN ANALYZE re-runs the statement, so plans are captured off the request
+# path, one at a time, and at most once per statement per interval
+_explain_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+_explained_at: Dict[str, float] = {}
+_explained_lock = threading.Lock()
+
+def get_slow_query_logger():
+    # Not cached: its handlers are detached when logging stops
+    return get_json_file_logger(
+        "tmsiti.slow_query",
+        settings.SLOW_QUERY_LOG_FILE,
+        settings.LOG_FILE_MAX_BYTES,
+        settings.LOG_FILE_BACKUPS,
+    )
+
+def redact_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, (str, bytes)):
+        return f"<{type(value).__name__} len={len(value)}>"
+    return f"<{type(value).__name__}>"
+
+def redact_parameters(parameters: Any) -> Any:
+    if isinstance(parameters, dict):
+        return {key: redact_value(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact_parameters(value) if isinstance(value, (dict, list, tuple)) else redact_value(value)
+                for value in parameters]
+    return redact_value(parameters)
+
+def _should_explain(connection, statement: str) -> bool:
+    if not settings.SLOW_QUERY_EXPLAIN or connection.dialect.name != "postgresql":
+        return False
+    if not statement.lstrip().upper().startswith("SELECT"):
+        return False
+    now = time.monotonic()
+    with _explained_lock:
+        last = _explained_at.get(statement)
+        if last is not None and now - last < settings.SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS:
+            return False
+        _explained_at[statement] = now
+    return True
+
+def _capture_plan(engine, query_id: str, statement: str, parameters: Any):
+    logger = get_slow_query_logger()
+    try:
+        with engine.connect() as connection:
+            transaction = connection.begin()
+            try:
+                result = connection.exec_driver_sql(
+                    "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + statement, parameters
+                )
+                plan = result.scalar()
+            finally:
+                transaction.rollback()
+        logger.info({"event": "slow_query_plan", "query_id": query_id, "plan": plan})
+    except Exception as exc:
+        logger.info({"event": "slow_query_plan_failed", "query_id": query_id, "error": repr(exc)})
+
+def log_slow_query(connection, statement: str, parameters: Any, duration: float, scope: Optional[dict]):
+    if statement.lstrip().upper().startswith("EXPLAIN"):
+        return
+    query_id = uuid.uuid4().hex
+    get_slow_query_logger().warning({
+        "event": "slow_query",
+        "query_id": query_id,
+        "duration_ms": round(duration * 1000, 2),
+        "statement": statement,
+        "parameters": redact_parameters(parameters),
+        "method": scope.get("method") if scope else None,
+        "route": route_template(scope) if scope else None,
+    })
+    if _should_explain(connection, statement):
+        _explain_executor.submit(_capture_plan, connection.engine, query_id, statement, parameters)
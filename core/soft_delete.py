@@ -0,0 +1,231 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+from sqlalchemy import Text, bindparam, event, or_, update
+from sqlalchemy.orm import Session, with_loader_criteria
+from core.config import settings
+from core.database import Base, SessionLocal
+from core.memory_index import invalidate_indexes
+from models import user, institute, regulatory, activities, news, contact, audit  # noqa: F401 (registers every model)
+from utils.file_handler import delete_file, embedded_upload_paths, scan_uploads, upload_path
+
+logger = logging.getLogger(__name__)
+
+# Models with a deleted_at column are soft deleted: ORM queries skip their
+# deleted rows unless run with execution_options(include_deleted=True), and
+# Purger hard-deletes them after SOFT_DELETE_RETENTION_DAYS
+SOFT_DELETE_MODELS = tuple(mapper.class_ for mapper in Base.registry.mappers if "deleted_at" in mapper.columns)
+FILE_MODELS = tuple(mapper.class_ for mapper in Base.registry.mappers if getattr(mapper.class_, "__file_columns__", ()))
+# Rich-text columns; files uploaded through the /upload endpoints are often
+# only linked from these, as /uploads/... URLs
+TEXT_COLUMNS = {
+    mapper.class_: tuple(column.key for column in mapper.columns if isinstance(column.type, Text))
+    for mapper in Base.registry.mappers
+    if any(isinstance(column.type, Text) for column in mapper.columns)
+}
+
+# For every soft deleted model rather than just execute_state.all_mappers,
+# which misses joined entities and the subquery Query.count() wraps
+_LIVE_ONLY = tuple(
+    with_loader_criteria(model, model.deleted_at.is_(None), include_aliases=True) for model in SOFT_DELETE_MODELS
+)
+
+def soft_delete(obj):
+    obj.deleted_at = datetime.now(timezone.utc)
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _exclude_deleted(execute_state):
+    if execute_state.is_select and not execute_state.execution_options.get("include_deleted", False):
+        execute_state.statement = execute_state.statement.options(*_LIVE_ONLY)
+
+class FileReference(NamedTuple):
+    model: Any
+    id: int
+    column: str
+    value: str
+    path: str
+
+def file_references(db: Session) -> Iterator[FileReference]:
+    """Every upload a file column points at, deleted rows included."""
+    for model in FILE_MODELS:
+        columns = [getattr(model, name) for name in model.__file_columns__]
+        query = db.query(model.id, *columns).execution_options(include_deleted=True, yield_per=1000)
+        for row in query:
+            for name, value in zip(model.__file_columns__, row[1:]):
+                path = upload_path(value)
+                if path:
+                    yield FileReference(model, row[0], name, value, path)
+
+def embedded_references(db: Session, paths: Iterable[str] = ()) -> Iterator[str]:
+    """Uploads linked from rich text, deleted rows included; only `paths` if given."""
+    needles = list(paths) or ["uploads/"]
+    for model, names in TEXT_COLUMNS.items():
+        columns = [getattr(model, name) for name in names]
+        query = (
+            db.query(*columns)
+            .execution_options(include_deleted=True, yield_per=1000)
+            .filter(or_(*(column.contains(needle, autoescape=True) for column in columns for needle in needles)))
+        )
+        for row in query:
+            for text in row:
+                yield from embedded_upload_paths(text)
+
+def delete_unreferenced(db: Session, paths: Iterable[str]) -> int:
+    candidates = set(filter(None, map(upload_path, paths)))
+    if not candidates:
+        return 0
+    # Looked up by value, in each form a column may store a path in
+    values = [value for path in candidates for value in (path, f"/uploads/{path}", f"uploads/{path}")]
+    used = set()
+    for model in FILE_MODELS:
+        for name in model.__file_columns__:
+            column = getattr(model, name)
+            query = db.query(column).execution_options(include_deleted=True).filter(column.in_(values))
+            used.update(upload_path(value) for (value,) in query)
+    unused = candidates - used
+    if unused:
+        unused -= set(embedded_references(db, unused))
+    return sum(delete_file(path) for path in unused)
+
+def clear_references(db: Session, references: Iterable[FileReference]) -> int:
+    """Null out file columns, only where they still hold the value seen."""
+    groups: Dict[Tuple[Any, str], List[dict]] = {}
+    for reference in references:
+        if reference.model.__table__.c[reference.column].nullable:
+            groups.setdefault((reference.model, reference.column), []).append(
+                {"_id": reference.id, "_value": reference.value}
+            )
+    cleared = 0
+    for (model, column), params in groups.items():
+        table = model.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("_id"), table.c[column] == bindparam("_value"))
+            .values({column: None})
+        )
+        cleared += db.connection().execute(statement, params).rowcount
+    db.commit()
+    if groups:
+        invalidate_indexes({model for model, _ in groups})
+    return cleared
+
+def reconcile_uploads(
+    db: Session, min_age_seconds: float, remove_orphans: bool = False
+) -> Tuple[List[str], List[FileReference]]:
+    """Files no row refers to, and references to files that do not exist.
+
+    A file is referenced by a file column or by a /uploads/... URL in a
+    rich-text column; only file columns are checked for dangling references.
+    Files younger than min_age_seconds are never orphans, since uploads are
+    attached to a row by a separate request. The tree is listed before
+    references are loaded, so a file attached meanwhile is seen as used,
+    and a reference to a file uploaded meanwhile is re-checked on disk.
+    """
+    files = scan_uploads()
+    references = list(file_references(db))
+    referenced = {reference.path for reference in references} | set(embedded_references(db))
+    cutoff = time.time() - min_age_seconds
+    orphans = sorted(path for path, mtime in files.items() if mtime <= cutoff and path not in referenced)
+    dangling = [
+        reference for reference in references
+        if reference.path not in files and not os.path.exists(os.path.join(settings.UPLOAD_DIR, reference.path))
+    ]
+    if remove_orphans:
+        for path in orphans:
+            delete_file(path)
+    return orphans, dangling
+
+def sweep_orphan_files(db: Session, min_age_seconds: float, remove: bool = False) -> List[str]:
+    """Files under UPLOAD_DIR that no row refers to, removed only if `remove`."""
+    orphans, _ = reconcile_uploads(db, min_age_seconds, remove_orphans=remove)
+    return orphans
+
+def purge_deleted(db: Session, cutoff: datetime) -> int:
+    """Hard-delete rows soft deleted before cutoff, then their unused files."""
+    purged = 0
+    for model in SOFT_DELETE_MODELS:
+        while True:
+            # SKIP LOCKED lets several workers purge side by side (PostgreSQL)
+            rows = (
+                db.query(model)
+                .execution_options(include_deleted=True)
+                .filter(model.deleted_at <= cutoff)
+                .order_by(model.id)
+                .limit(settings.SOFT_DELETE_PURGE_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            if not rows:
+                break
+            files = [getattr(row, name) for row in rows for name in getattr(model, "__file_columns__", ())]
+            for row in rows:
+                db.delete(row)
+            db.commit()
+            purged += len(rows)
+            delete_unreferenced(db, files)
+            if len(rows) < settings.SOFT_DELETE_PURGE_BATCH_SIZE:
+                break
+    return purged
+
+class Purger:
+    """Purges expired soft deletes and sweeps orphaned uploads in the background.
+
+    The sweep only reports orphans unless FILE_SWEEP_REMOVE is set, and
+    first runs one FILE_SWEEP_INTERVAL_SECONDS after start.
+    """
+
+    def __init__(self):
+        self._stop = threading.Event()
+        self._thread = None
+        self._swept_at = float("-inf")
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._swept_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="purger", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Purge run failed")
+            self._stop.wait(settings.SOFT_DELETE_PURGE_INTERVAL_SECONDS)
+
+    def run_once(self):
+        db = SessionLocal()
+        try:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=settings.SOFT_DELETE_RETENTION_DAYS)
+            purged = purge_deleted(db, cutoff)
+            if purged:
+                logger.info("Purged %d soft deleted rows", purged)
+            if time.monotonic() - self._swept_at >= settings.FILE_SWEEP_INTERVAL_SECONDS:
+                orphans = sweep_orphan_files(db, settings.FILE_SWEEP_MIN_AGE_SECONDS, settings.FILE_SWEEP_REMOVE)
+                self._swept_at = time.monotonic()
+                if orphans and settings.FILE_SWEEP_REMOVE:
+                    logger.info("Removed %d orphaned uploads", len(orphans))
+                elif orphans:
+                    logger.warning(
+                        "Found %d orphaned uploads; see `python manage.py reconcile-uploads`", len(orphans)
+                    )
+        finally:
+            db.close()
+
+purger = Purger()
@@ -1,31 +1,102 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+import logging
 import os
 from core.config import settings
-from core.database import Base, engine
-from api import auth, institute, regulatory, activities, news, contact
+from core.audit import audit_writer
+from core.database import engine, replica_router, warm_pool, is_statement_timeout
+from core.metrics import REQUEST_TIMEOUTS, route_template
+from core.logging import setup_logging, stop_logging
+from core.memory_index import warm_indexes
+from core.publishing import publishing_scheduler
+from core.soft_delete import purger
+from api import auth, institute, regulatory, activities, news, contact, health, metrics, admin
+from utils.middleware import (
+    MetricsMiddleware, QueryStatsMiddleware, ProfilingMiddleware, AccessLogMiddleware, TimeoutMiddleware,
+    AdmissionControlMiddleware
+)
+
+logger = logging.getLogger(__name__)
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# Tables are managed by migrations: `python manage.py migrate`
 
 # Create upload directory
 os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_logging()
+    audit_writer.start()
+    if settings.WARM_POOL_SIZE > 0:
+        try:
+            await run_in_threadpool(warm_pool, settings.WARM_POOL_SIZE)
+        except Exception:
+            # The database may come up after us; readiness reports it meanwhile
+            logger.warning("Could not warm the database pool", exc_info=True)
+    if settings.WARM_MEMORY_INDEXES:
+        try:
+            await run_in_threadpool(warm_indexes)
+        except Exception:
+            # Indexes load lazily on first use instead
+            logger.warning("Could not warm in-memory indexes", exc_info=True)
+    replica_router.start()
+    if settings.PUBLISHING_SCHEDULER_ENABLED:
+        publishing_scheduler.start()
+    if settings.PURGER_ENABLED:
+        purger.start()
+    app.state.started = True
+    yield
+    app.state.started = False
+    purger.stop()
+    publishing_scheduler.stop()
+    replica_router.stop()
+    audit_writer.stop()
+    stop_logging()
+    engine.dispose()
+    for replica in replica_router.engines:
+        replica.dispose()
+
 app = FastAPI(
     title="TMSITI API",
     description="API for TMSITI Website",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# CORS middleware
+# Middleware added later wraps the ones added before it
+
+# Request deadlines and statement timeouts (504/503)
+app.add_middleware(TimeoutMiddleware)
+
+# Per-request SQL statement count and time (Server-Timing)
+app.add_middleware(QueryStatsMiddleware)
+
+# Per route group concurrency limits; excess load gets a fast 503
+app.add_middleware(AdmissionControlMiddleware)
+
+# Request metrics, exposed on /metrics
+app.add_middleware(MetricsMiddleware)
+
+# Structured access log, written off the request path
+app.add_middleware(AccessLogMiddleware)
+
+# Opt-in per-request profiling for admins (X-Profile: 1)
+app.add_middleware(ProfilingMiddleware)
+
+# CORS middleware; outermost, so the 503s and 504s answered by the
+# middleware above carry CORS headers too
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After"],
 )
 
 # Mount static files
@@ -38,24 +109,37 @@ app.include_router(regulatory.router, prefix="/api/v1")
 app.include_router(activities.router, prefix="/api/v1")
 app.include_router(news.router, prefix="/api/v1")
 app.include_router(contact.router, prefix="/api/v1")
+app.include_router(admin.router, prefix="/api/v1")
+app.include_router(health.router)
+app.include_router(metrics.router)
 
 @app.get("/")
 async def root():
     return {"message": "TMSITI API is running", "version": "1.0.0"}
 
-@app.get("/health")
-async def health_check():
-    return {"status": "healthy"}
+# Database timeouts: cancelled statements and an exhausted connection pool
+@app.exception_handler(OperationalError)
+async def database_error_handler(request: Request, exc: OperationalError):
+    if is_statement_timeout(exc):
+        REQUEST_TIMEOUTS.inc(route=route_template(request.scope), kind="statement")
+        return JSONResponse(status_code=503, content={"detail": "Database query timed out"}, headers={"Retry-After": "1"})
+    logger.error("Database error", exc_info=exc)
+    return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    REQUEST_TIMEOUTS.inc(route=route_template(request.scope), kind="pool")
+    return JSONResponse(status_code=503, content={"detail": "Database busy"}, headers={"Retry-After": "1"})
 
 # Custom 404 handler
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc: HTTPException):
-    return {"detail": "Not found"}
+    return JSONResponse(status_code=404, content={"detail": getattr(exc, "detail", "Not found")})
 
 # Custom 500 handler
 @app.exception_handler(500)
 async def internal_error_handler(request: Request, exc: HTTPException):
-    return {"detail": "Internal server error"}
+    return JSONResponse(status_code=500, content={"detail": "Internal server error"})
 
 if __name__ == "__main__":
     import uvicorn
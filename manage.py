@@ -0,0 +1,54 @@
+import argparse
+import sys
+from alembic import command
+from alembic.config import Config
+
+def migrate(args):
+    command.upgrade(Config("alembic.ini"), args.revision)
+
+def reconcile_uploads(args):
+    # Imported here so `migrate` works before the schema exists
+    from core.database import SessionLocal
+    from core.soft_delete import clear_references, reconcile_uploads
+
+    db = SessionLocal()
+    try:
+        orphans, dangling = reconcile_uploads(db, args.min_age_hours * 3600, remove_orphans=args.remove)
+        cleared = clear_references(db, dangling) if args.remove else 0
+    finally:
+        db.close()
+    for path in orphans:
+        print(f"orphan\t{path}")
+    for reference in dangling:
+        print(f"dangling\t{reference.model.__tablename__}.{reference.column}\t{reference.id}\t{reference.value}")
+    summary = f"{len(orphans)} orphaned files, {len(dangling)} dangling references"
+    if args.remove:
+        summary += f"; files removed, {cleared} references cleared"
+    print(summary, file=sys.stderr)
+
+def main():
+    parser = argparse.ArgumentParser(description="TMSITI management commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="Apply database migrations")
+    migrate_parser.add_argument("revision", nargs="?", default="head")
+    migrate_parser.set_defaults(func=migrate)
+
+    reconcile_parser = subparsers.add_parser(
+        "reconcile-uploads", help="Report files no row refers to and references to missing files"
+    )
+    reconcile_parser.add_argument(
+        "--remove", action="store_true",
+        help="Delete orphaned files and clear dangling references (where the column is nullable)"
+    )
+    reconcile_parser.add_argument(
+        "--min-age-hours", type=float, default=24.0,
+        help="Only count files older than this as orphaned, sparing uploads not yet attached"
+    )
+    reconcile_parser.set_defaults(func=reconcile_uploads)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
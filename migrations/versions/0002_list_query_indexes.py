@@ -0,0 +1,50 @@
+"""list query indexes
+
+Indexes matching the ORDER BY / WHERE of each list endpoint. The partial
+indexes cover the default active_only / published_only listings.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 06:18:36.669640
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index('ix_announcements_active_created_at', 'announcements', ['created_at'], unique=False, postgresql_where=sa.text('is_active'))
+    op.create_index('ix_announcements_created_at', 'announcements', ['created_at'], unique=False)
+    op.create_index('ix_anti_corruption_created_at', 'anti_corruption', ['created_at'], unique=False)
+    op.create_index('ix_building_regulations_number', 'building_regulations', ['number'], unique=False)
+    op.create_index('ix_construction_norms_subsystem_group_code', 'construction_norms', ['subsystem', 'group', 'code'], unique=False)
+    op.create_index('ix_management_order_index_created_at', 'management', ['order_index', 'created_at'], unique=False)
+    op.create_index('ix_management_systems_created_at', 'management_systems', ['created_at'], unique=False)
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_index('ix_meetings_meeting_date_created_at', 'meetings', [sa.literal_column('meeting_date DESC NULLS LAST'), sa.literal_column('created_at DESC')], unique=False)
+    op.create_index('ix_news_created_at', 'news', ['created_at'], unique=False)
+    op.create_index('ix_news_published_created_at', 'news', ['created_at'], unique=False, postgresql_where=sa.text('is_published'))
+    op.create_index('ix_references_number', 'references', ['number'], unique=False)
+    op.create_index('ix_structural_divisions_created_at', 'structural_divisions', ['created_at'], unique=False)
+    op.create_index('ix_vacancies_active_created_at', 'vacancies', ['created_at'], unique=False, postgresql_where=sa.text('is_active'))
+    op.create_index('ix_vacancies_created_at', 'vacancies', ['created_at'], unique=False)
+
+def downgrade():
+    op.drop_index('ix_vacancies_created_at', table_name='vacancies')
+    op.drop_index('ix_vacancies_active_created_at', table_name='vacancies', postgresql_where=sa.text('is_active'))
+    op.drop_index('ix_structural_divisions_created_at', table_name='structural_divisions')
+    op.drop_index('ix_references_number', table_name='references')
+    op.drop_index('ix_news_published_created_at', table_name='news', postgresql_where=sa.text('is_published'))
+    op.drop_index('ix_news_created_at', table_name='news')
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index('ix_meetings_meeting_date_created_at', table_name='meetings')
+    op.drop_index('ix_management_systems_created_at', table_name='management_systems')
+    op.drop_index('ix_management_order_index_created_at', table_name='management')
+    op.drop_index('ix_construction_norms_subsystem_group_code', table_name='construction_norms')
+    op.drop_index('ix_building_regulations_number', table_name='building_regulations')
+    op.drop_index('ix_anti_corruption_created_at', table_name='anti_corruption')
+    op.drop_index('ix_announcements_created_at', table_name='announcements')
+    op.drop_index('ix_announcements_active_created_at', table_name='announcements', postgresql_where=sa.text('is_active'))
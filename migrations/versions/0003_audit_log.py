@@ -0,0 +1,37 @@
+"""audit log
+
+Who created, updated or deleted which row, written in batches by core.audit.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 06:25:28.519575
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('audit_log',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('user_email', sa.String(), nullable=True),
+    sa.Column('action', sa.String(), nullable=False),
+    sa.Column('entity', sa.String(), nullable=False),
+    sa.Column('entity_id', sa.String(), nullable=True),
+    sa.Column('changed_fields', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_audit_log_created_at', 'audit_log', ['created_at'], unique=False)
+    op.create_index('ix_audit_log_entity_entity_id', 'audit_log', ['entity', 'entity_id'], unique=False)
+    op.create_index(op.f('ix_audit_log_id'), 'audit_log', ['id'], unique=False)
+
+def downgrade():
+    op.drop_index(op.f('ix_audit_log_id'), table_name='audit_log')
+    op.drop_index('ix_audit_log_entity_entity_id', table_name='audit_log')
+    op.drop_index('ix_audit_log_created_at', table_name='audit_log')
+    op.drop_table('audit_log')
@@ -0,0 +1,68 @@
+"""cost resource norm shnq links
+
+Link table from cost resource norms to the ShNQ codes they reference,
+backfilled from main_shnq_code and the additional_shnqs JSON. The
+backfill reads rows, so it is skipped when generating offline SQL.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 06:31:37.009255
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+def _links(norm):
+    # Same rules as models.regulatory.shnq_links, frozen for this revision
+    entries = [{"code": norm.main_shnq_code, "title": norm.main_shnq_title}] + list(norm.additional_shnqs or [])
+    links = {}
+    for position, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            entry = {"code": entry}
+        code = str(entry.get("code") or "").strip()
+        if code and code not in links:
+            links[code] = {
+                "cost_resource_norm_id": norm.id, "shnq_code": code,
+                "shnq_title": entry.get("title"), "is_main": position == 0,
+            }
+    return list(links.values())
+
+def upgrade():
+    op.create_table('cost_resource_norm_shnqs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('cost_resource_norm_id', sa.Integer(), nullable=False),
+    sa.Column('shnq_code', sa.String(), nullable=False),
+    sa.Column('shnq_title', sa.String(), nullable=True),
+    sa.Column('is_main', sa.Boolean(), nullable=False),
+    sa.ForeignKeyConstraint(['cost_resource_norm_id'], ['cost_resource_norms.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('cost_resource_norm_id', 'shnq_code', name='uq_cost_resource_norm_shnqs_norm_code')
+    )
+    op.create_index('ix_cost_resource_norm_shnqs_shnq_code', 'cost_resource_norm_shnqs', ['shnq_code', 'cost_resource_norm_id'], unique=False)
+
+    if context.is_offline_mode():
+        return
+    norms = sa.table(
+        'cost_resource_norms', sa.column('id'), sa.column('main_shnq_code'), sa.column('main_shnq_title'),
+        sa.column('additional_shnqs', sa.JSON())
+    )
+    links = sa.table(
+        'cost_resource_norm_shnqs', sa.column('cost_resource_norm_id'), sa.column('shnq_code'),
+        sa.column('shnq_title'), sa.column('is_main')
+    )
+    result = op.get_bind().execute(sa.select(norms).order_by(norms.c.id))
+    while True:
+        rows = result.fetchmany(BATCH_SIZE)
+        if not rows:
+            break
+        op.bulk_insert(links, [link for norm in rows for link in _links(norm)])
+
+def downgrade():
+    op.drop_index('ix_cost_resource_norm_shnqs_shnq_code', table_name='cost_resource_norm_shnqs')
+    op.drop_table('cost_resource_norm_shnqs')
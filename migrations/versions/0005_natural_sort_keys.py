@@ -0,0 +1,90 @@
+"""natural sort keys
+
+Natural-order sort keys for regulatory code/number columns, maintained
+by the models on write, backfilled here and indexed for the list
+endpoints' ORDER BY. The backfill reads rows, so it is skipped when
+generating offline SQL.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 06:35:29.854301
+"""
+import re
+from alembic import context, op
+import sqlalchemy as sa
+
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+# (table, source column, key column)
+SORT_KEYS = [
+    ('building_regulations', 'number', 'number_sort_key'),
+    ('construction_norms', 'code', 'code_sort_key'),
+    ('cost_resource_norms', 'srn_code', 'srn_code_sort_key'),
+    ('references', 'number', 'number_sort_key'),
+    ('standards', 'code', 'code_sort_key'),
+    ('technical_regulations', 'code', 'code_sort_key'),
+]
+
+def natural_sort_key(value):
+    # Same rules as models.regulatory.natural_sort_key, frozen for this revision
+    if value is None:
+        return None
+    parts = []
+    for part in re.findall(r"\d+|[^\W\d_]+", re.sub(r"[ʻʼ‘’`']", "", value.casefold())):
+        if part.isdigit():
+            part = part.lstrip("0") or "0"
+            part = f"{len(part):02d} {part}"
+        parts.append(part)
+    return " ".join(parts)
+
+def backfill(table_name, source, key):
+    table = sa.table(table_name, sa.column('id'), sa.column(source), sa.column(key))
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(table.c.id, table.c[source])).fetchall()
+    update = table.update().where(table.c.id == sa.bindparam('row_id')).values({key: sa.bindparam('sort_key')})
+    for start in range(0, len(rows), BATCH_SIZE):
+        batch = rows[start:start + BATCH_SIZE]
+        bind.execute(update, [{'row_id': row[0], 'sort_key': natural_sort_key(row[1])} for row in batch])
+
+def upgrade():
+    op.add_column('building_regulations', sa.Column('number_sort_key', sa.String().with_variant(sa.String(collation='C'), 'postgresql'), nullable=True))
+    op.drop_index(op.f('ix_building_regulations_number'), table_name='building_regulations')
+    op.create_index('ix_building_regulations_number_sort_key', 'building_regulations', ['number_sort_key'], unique=False)
+    op.add_column('construction_norms', sa.Column('code_sort_key', sa.String().with_variant(sa.String(collation='C'), 'postgresql'), nullable=True))
+    op.drop_index(op.f('ix_construction_norms_subsystem_group_code'), table_name='construction_norms')
+    op.create_index('ix_construction_norms_subsystem_group_code_sort_key', 'construction_norms', ['subsystem', 'group', 'code_sort_key'], unique=False)
+    op.add_column('cost_resource_norms', sa.Column('srn_code_sort_key', sa.String().with_variant(sa.String(collation='C'), 'postgresql'), nullable=True))
+    op.create_index('ix_cost_resource_norms_srn_code_sort_key', 'cost_resource_norms', ['srn_code_sort_key'], unique=False)
+    op.add_column('references', sa.Column('number_sort_key', sa.String().with_variant(sa.String(collation='C'), 'postgresql'), nullable=True))
+    op.drop_index(op.f('ix_references_number'), table_name='references')
+    op.create_index('ix_references_number_sort_key', 'references', ['number_sort_key'], unique=False)
+    op.add_column('standards', sa.Column('code_sort_key', sa.String().with_variant(sa.String(collation='C'), 'postgresql'), nullable=True))
+    op.create_index('ix_standards_code_sort_key', 'standards', ['code_sort_key'], unique=False)
+    op.add_column('technical_regulations', sa.Column('code_sort_key', sa.String().with_variant(sa.String(collation='C'), 'postgresql'), nullable=True))
+    op.create_index('ix_technical_regulations_code_sort_key', 'technical_regulations', ['code_sort_key'], unique=False)
+
+    if not context.is_offline_mode():
+        for table_name, source, key in SORT_KEYS:
+            backfill(table_name, source, key)
+
+def downgrade():
+    op.drop_index('ix_technical_regulations_code_sort_key', table_name='technical_regulations')
+    op.drop_column('technical_regulations', 'code_sort_key')
+    op.drop_index('ix_standards_code_sort_key', table_name='standards')
+    op.drop_column('standards', 'code_sort_key')
+    op.drop_index('ix_references_number_sort_key', table_name='references')
+    op.create_index(op.f('ix_references_number'), 'references', ['number'], unique=False)
+    op.drop_column('references', 'number_sort_key')
+    op.drop_index('ix_cost_resource_norms_srn_code_sort_key', table_name='cost_resource_norms')
+    op.drop_column('cost_resource_norms', 'srn_code_sort_key')
+    op.drop_index('ix_construction_norms_subsystem_group_code_sort_key', table_name='construction_norms')
+    op.create_index(op.f('ix_construction_norms_subsystem_group_code'), 'construction_norms', ['subsystem', 'group', 'code'], unique=False)
+    op.drop_column('construction_norms', 'code_sort_key')
+    op.drop_index('ix_building_regulations_number_sort_key', table_name='building_regulations')
+    op.create_index(op.f('ix_building_regulations_number'), 'building_regulations', ['number'], unique=False)
+    op.drop_column('building_regulations', 'number_sort_key')
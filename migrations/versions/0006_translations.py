@@ -0,0 +1,110 @@
+"""translations
+
+Russian and English columns next to each translated field (the base
+column holds Uzbek), and trigram indexes for ILIKE search on the
+regulatory titles in every locale (PostgreSQL, pg_trgm).
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 06:37:42.936719
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+TRIGRAM_INDEXES = [
+    ('building_regulations', 'title'),
+    ('cost_resource_norms', 'srn_title'),
+    ('references', 'title'),
+    ('standards', 'title'),
+    ('technical_regulations', 'title'),
+]
+
+def trigram_columns():
+    for table, field in TRIGRAM_INDEXES:
+        for name in (field, f'{field}_ru', f'{field}_en'):
+            yield table, name
+
+def upgrade():
+    op.add_column('about', sa.Column('content_ru', sa.Text(), nullable=True))
+    op.add_column('about', sa.Column('content_en', sa.Text(), nullable=True))
+    op.add_column('announcements', sa.Column('title_ru', sa.String(), nullable=True))
+    op.add_column('announcements', sa.Column('title_en', sa.String(), nullable=True))
+    op.add_column('announcements', sa.Column('content_ru', sa.Text(), nullable=True))
+    op.add_column('announcements', sa.Column('content_en', sa.Text(), nullable=True))
+    op.add_column('building_regulations', sa.Column('title_ru', sa.String(), nullable=True))
+    op.add_column('building_regulations', sa.Column('title_en', sa.String(), nullable=True))
+    op.add_column('construction_norms', sa.Column('title_ru', sa.String(), nullable=True))
+    op.add_column('construction_norms', sa.Column('title_en', sa.String(), nullable=True))
+    op.add_column('cost_resource_norms', sa.Column('srn_title_ru', sa.String(), nullable=True))
+    op.add_column('cost_resource_norms', sa.Column('srn_title_en', sa.String(), nullable=True))
+    op.add_column('cost_resource_norms', sa.Column('main_shnq_title_ru', sa.String(), nullable=True))
+    op.add_column('cost_resource_norms', sa.Column('main_shnq_title_en', sa.String(), nullable=True))
+    op.add_column('news', sa.Column('title_ru', sa.String(), nullable=True))
+    op.add_column('news', sa.Column('title_en', sa.String(), nullable=True))
+    op.add_column('news', sa.Column('content_ru', sa.Text(), nullable=True))
+    op.add_column('news', sa.Column('content_en', sa.Text(), nullable=True))
+    op.add_column('references', sa.Column('title_ru', sa.String(), nullable=True))
+    op.add_column('references', sa.Column('title_en', sa.String(), nullable=True))
+    op.add_column('standards', sa.Column('title_ru', sa.String(), nullable=True))
+    op.add_column('standards', sa.Column('title_en', sa.String(), nullable=True))
+    op.add_column('standards', sa.Column('description_ru', sa.Text(), nullable=True))
+    op.add_column('standards', sa.Column('description_en', sa.Text(), nullable=True))
+    op.add_column('technical_regulations', sa.Column('title_ru', sa.String(), nullable=True))
+    op.add_column('technical_regulations', sa.Column('title_en', sa.String(), nullable=True))
+    op.add_column('technical_regulations', sa.Column('description_ru', sa.Text(), nullable=True))
+    op.add_column('technical_regulations', sa.Column('description_en', sa.Text(), nullable=True))
+    op.add_column('vacancies', sa.Column('title_ru', sa.String(), nullable=True))
+    op.add_column('vacancies', sa.Column('title_en', sa.String(), nullable=True))
+    op.add_column('vacancies', sa.Column('description_ru', sa.Text(), nullable=True))
+    op.add_column('vacancies', sa.Column('description_en', sa.Text(), nullable=True))
+    op.add_column('vacancies', sa.Column('requirements_ru', sa.Text(), nullable=True))
+    op.add_column('vacancies', sa.Column('requirements_en', sa.Text(), nullable=True))
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for table, name in trigram_columns():
+            op.create_index(f'ix_{table}_{name}_trgm', table, [name], unique=False, postgresql_using='gin', postgresql_ops={name: 'gin_trgm_ops'})
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        for table, name in trigram_columns():
+            op.drop_index(f'ix_{table}_{name}_trgm', table_name=table)
+    op.drop_column('vacancies', 'requirements_en')
+    op.drop_column('vacancies', 'requirements_ru')
+    op.drop_column('vacancies', 'description_en')
+    op.drop_column('vacancies', 'description_ru')
+    op.drop_column('vacancies', 'title_en')
+    op.drop_column('vacancies', 'title_ru')
+    op.drop_column('technical_regulations', 'description_en')
+    op.drop_column('technical_regulations', 'description_ru')
+    op.drop_column('technical_regulations', 'title_en')
+    op.drop_column('technical_regulations', 'title_ru')
+    op.drop_column('standards', 'description_en')
+    op.drop_column('standards', 'description_ru')
+    op.drop_column('standards', 'title_en')
+    op.drop_column('standards', 'title_ru')
+    op.drop_column('references', 'title_en')
+    op.drop_column('references', 'title_ru')
+    op.drop_column('news', 'content_en')
+    op.drop_column('news', 'content_ru')
+    op.drop_column('news', 'title_en')
+    op.drop_column('news', 'title_ru')
+    op.drop_column('cost_resource_norms', 'main_shnq_title_en')
+    op.drop_column('cost_resource_norms', 'main_shnq_title_ru')
+    op.drop_column('cost_resource_norms', 'srn_title_en')
+    op.drop_column('cost_resource_norms', 'srn_title_ru')
+    op.drop_column('construction_norms', 'title_en')
+    op.drop_column('construction_norms', 'title_ru')
+    op.drop_column('building_regulations', 'title_en')
+    op.drop_column('building_regulations', 'title_ru')
+    op.drop_column('announcements', 'content_en')
+    op.drop_column('announcements', 'content_ru')
+    op.drop_column('announcements', 'title_en')
+    op.drop_column('announcements', 'title_ru')
+    op.drop_column('about', 'content_en')
+    op.drop_column('about', 'content_ru')
@@ -0,0 +1,44 @@
+"""publishing schedule
+
+publish_at/expire_at on news, announcements and vacancies, with partial
+indexes the publishing scheduler reads its next due time from.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 06:40:58.886529
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('announcements', sa.Column('publish_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('announcements', sa.Column('expire_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('ix_announcements_expire_at', 'announcements', ['expire_at'], unique=False, postgresql_where=sa.text('expire_at IS NOT NULL'))
+    op.create_index('ix_announcements_publish_at', 'announcements', ['publish_at'], unique=False, postgresql_where=sa.text('publish_at IS NOT NULL'))
+    op.add_column('news', sa.Column('publish_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('news', sa.Column('expire_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('ix_news_expire_at', 'news', ['expire_at'], unique=False, postgresql_where=sa.text('expire_at IS NOT NULL'))
+    op.create_index('ix_news_publish_at', 'news', ['publish_at'], unique=False, postgresql_where=sa.text('publish_at IS NOT NULL'))
+    op.add_column('vacancies', sa.Column('publish_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('vacancies', sa.Column('expire_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('ix_vacancies_expire_at', 'vacancies', ['expire_at'], unique=False, postgresql_where=sa.text('expire_at IS NOT NULL'))
+    op.create_index('ix_vacancies_publish_at', 'vacancies', ['publish_at'], unique=False, postgresql_where=sa.text('publish_at IS NOT NULL'))
+
+def downgrade():
+    op.drop_index('ix_vacancies_publish_at', table_name='vacancies', postgresql_where=sa.text('publish_at IS NOT NULL'))
+    op.drop_index('ix_vacancies_expire_at', table_name='vacancies', postgresql_where=sa.text('expire_at IS NOT NULL'))
+    op.drop_column('vacancies', 'expire_at')
+    op.drop_column('vacancies', 'publish_at')
+    op.drop_index('ix_news_publish_at', table_name='news', postgresql_where=sa.text('publish_at IS NOT NULL'))
+    op.drop_index('ix_news_expire_at', table_name='news', postgresql_where=sa.text('expire_at IS NOT NULL'))
+    op.drop_column('news', 'expire_at')
+    op.drop_column('news', 'publish_at')
+    op.drop_index('ix_announcements_publish_at', table_name='announcements', postgresql_where=sa.text('publish_at IS NOT NULL'))
+    op.drop_index('ix_announcements_expire_at', table_name='announcements', postgresql_where=sa.text('expire_at IS NOT NULL'))
+    op.drop_column('announcements', 'expire_at')
+    op.drop_column('announcements', 'publish_at')
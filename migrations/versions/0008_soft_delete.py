@@ -0,0 +1,95 @@
+"""soft delete
+
+deleted_at on every content table, with a partial index over deleted rows
+for the purger. Unique codes become partial unique indexes over live rows,
+and on PostgreSQL the list indexes are rebuilt to exclude deleted rows.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 06:52:10.412977
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+TABLES = [
+    'about', 'announcements', 'anti_corruption', 'building_regulations', 'construction_norms',
+    'cost_resource_norms', 'management', 'management_systems', 'meetings', 'news', 'references',
+    'standards', 'structural_divisions', 'structure', 'technical_regulations', 'vacancies',
+]
+
+UNIQUE_CODES = [
+    ('building_regulations', 'code'),
+    ('construction_norms', 'code'),
+    ('cost_resource_norms', 'srn_code'),
+    ('standards', 'code'),
+    ('technical_regulations', 'code'),
+]
+
+# (name, table, columns, where) of the list indexes as of 0007
+LIST_INDEXES = [
+    ('ix_announcements_created_at', 'announcements', ['created_at'], None),
+    ('ix_announcements_active_created_at', 'announcements', ['created_at'], 'is_active'),
+    ('ix_anti_corruption_created_at', 'anti_corruption', ['created_at'], None),
+    ('ix_building_regulations_number_sort_key', 'building_regulations', ['number_sort_key'], None),
+    ('ix_construction_norms_subsystem_group_code_sort_key', 'construction_norms', ['subsystem', 'group', 'code_sort_key'], None),
+    ('ix_cost_resource_norms_srn_code_sort_key', 'cost_resource_norms', ['srn_code_sort_key'], None),
+    ('ix_management_order_index_created_at', 'management', ['order_index', 'created_at'], None),
+    ('ix_management_systems_created_at', 'management_systems', ['created_at'], None),
+    ('ix_meetings_meeting_date_created_at', 'meetings', [sa.literal_column('meeting_date DESC NULLS LAST'), sa.literal_column('created_at DESC')], None),
+    ('ix_news_created_at', 'news', ['created_at'], None),
+    ('ix_news_published_created_at', 'news', ['created_at'], 'is_published'),
+    ('ix_references_number_sort_key', 'references', ['number_sort_key'], None),
+    ('ix_standards_code_sort_key', 'standards', ['code_sort_key'], None),
+    ('ix_structural_divisions_created_at', 'structural_divisions', ['created_at'], None),
+    ('ix_technical_regulations_code_sort_key', 'technical_regulations', ['code_sort_key'], None),
+    ('ix_vacancies_created_at', 'vacancies', ['created_at'], None),
+    ('ix_vacancies_active_created_at', 'vacancies', ['created_at'], 'is_active'),
+]
+
+LIVE = 'deleted_at IS NULL'
+
+def create_list_indexes(live_only):
+    for name, table, columns, where in LIST_INDEXES:
+        if live_only:
+            where = f'{where} AND {LIVE}' if where else LIVE
+        op.create_index(
+            name, table, columns, unique=False,
+            postgresql_where=sa.text(where) if where else None
+        )
+
+def upgrade():
+    for table in TABLES:
+        op.add_column(table, sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+        op.create_index(f'ix_{table}_deleted_at', table, ['deleted_at'], unique=False, postgresql_where=sa.text('deleted_at IS NOT NULL'))
+
+    # The unnamed UNIQUE constraints from 0001 carry PostgreSQL's default names;
+    # on SQLite batch mode rebuilds the table under the same convention
+    for table, column in UNIQUE_CODES:
+        with op.batch_alter_table(table, naming_convention={'uq': '%(table_name)s_%(column_0_name)s_key'}) as batch_op:
+            batch_op.drop_constraint(f'{table}_{column}_key', type_='unique')
+        op.create_index(f'uq_{table}_{column}', table, [column], unique=True, postgresql_where=sa.text(LIVE), sqlite_where=sa.text(LIVE))
+
+    if op.get_bind().dialect.name == 'postgresql':
+        for name, table, _, _ in LIST_INDEXES:
+            op.drop_index(name, table_name=table)
+        create_list_indexes(live_only=True)
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        for name, table, _, _ in LIST_INDEXES:
+            op.drop_index(name, table_name=table)
+        create_list_indexes(live_only=False)
+
+    for table, column in UNIQUE_CODES:
+        op.drop_index(f'uq_{table}_{column}', table_name=table)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.create_unique_constraint(f'{table}_{column}_key', [column])
+
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_deleted_at', table_name=table)
+        op.drop_column(table, 'deleted_at')
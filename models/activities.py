@@ -1,13 +1,20 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index
 from sqlalchemy.sql import func
 from core.database import Base
 
 class ManagementSystem(Base):
     __tablename__ = "management_systems"
+    __file_columns__ = ("pdf",)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=False)
     pdf = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_management_systems_created_at", "created_at", postgresql_where=deleted_at.is_(None)),
+        Index("ix_management_systems_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
\ No newline at end of file
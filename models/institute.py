@@ -1,18 +1,28 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from core.database import Base
 
 class About(Base):
     __tablename__ = "about"
+    __translated__ = ("content",)
+    __file_columns__ = ("pdf_url",)
 
     id = Column(Integer, primary_key=True, index=True)
     content = Column(Text, nullable=False)
+    content_ru = Column(Text, nullable=True)
+    content_en = Column(Text, nullable=True)
     pdf_url = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_about_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
 
 class Management(Base):
     __tablename__ = "management"
+    __file_columns__ = ("profile_image",)
 
     id = Column(Integer, primary_key=True, index=True)
     full_name = Column(String, nullable=False)
@@ -25,18 +35,31 @@ class Management(Base):
     order_index = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_management_order_index_created_at", "order_index", "created_at", postgresql_where=deleted_at.is_(None)),
+        Index("ix_management_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
 
 class Structure(Base):
     __tablename__ = "structure"
+    __file_columns__ = ("pdf_url",)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     pdf_url = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_structure_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
 
 class StructuralDivision(Base):
     __tablename__ = "structural_divisions"
+    __file_columns__ = ("profile_image",)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -46,17 +69,43 @@ class StructuralDivision(Base):
     profile_image = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_structural_divisions_created_at", "created_at", postgresql_where=deleted_at.is_(None)),
+        Index("ix_structural_divisions_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
 
 class Vacancy(Base):
     __tablename__ = "vacancies"
+    __translated__ = ("title", "description", "requirements")
+    __file_columns__ = ("attachment",)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
+    title_ru = Column(String, nullable=True)
+    title_en = Column(String, nullable=True)
     description = Column(Text, nullable=False)
+    description_ru = Column(Text, nullable=True)
+    description_en = Column(Text, nullable=True)
     requirements = Column(Text, nullable=False)
+    requirements_ru = Column(Text, nullable=True)
+    requirements_en = Column(Text, nullable=True)
     deadline = Column(DateTime, nullable=True)
     contact_email = Column(String, nullable=False)
     attachment = Column(String, nullable=True)
     is_active = Column(Boolean, default=True)
+    publish_at = Column(DateTime(timezone=True), nullable=True)
+    expire_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __visibility_flag__ = "is_active"
+    __table_args__ = (
+        Index("ix_vacancies_created_at", "created_at", postgresql_where=deleted_at.is_(None)),
+        Index("ix_vacancies_active_created_at", "created_at", postgresql_where=is_active & deleted_at.is_(None)),
+        Index("ix_vacancies_publish_at", "publish_at", postgresql_where=publish_at.isnot(None)),
+        Index("ix_vacancies_expire_at", "expire_at", postgresql_where=expire_at.isnot(None)),
+        Index("ix_vacancies_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
\ No newline at end of file
@@ -1,31 +1,68 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from core.database import Base
 
 class Announcement(Base):
     __tablename__ = "announcements"
+    __translated__ = ("title", "content")
+    __file_columns__ = ("attachment",)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
+    title_ru = Column(String, nullable=True)
+    title_en = Column(String, nullable=True)
     content = Column(Text, nullable=False)
+    content_ru = Column(Text, nullable=True)
+    content_en = Column(Text, nullable=True)
     attachment = Column(String, nullable=True)
     is_active = Column(Boolean, default=True)
+    publish_at = Column(DateTime(timezone=True), nullable=True)
+    expire_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __visibility_flag__ = "is_active"
+    __table_args__ = (
+        Index("ix_announcements_created_at", "created_at", postgresql_where=deleted_at.is_(None)),
+        Index("ix_announcements_active_created_at", "created_at", postgresql_where=is_active & deleted_at.is_(None)),
+        Index("ix_announcements_publish_at", "publish_at", postgresql_where=publish_at.isnot(None)),
+        Index("ix_announcements_expire_at", "expire_at", postgresql_where=expire_at.isnot(None)),
+        Index("ix_announcements_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
 
 class News(Base):
     __tablename__ = "news"
+    __translated__ = ("title", "content")
+    __file_columns__ = ("image",)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
+    title_ru = Column(String, nullable=True)
+    title_en = Column(String, nullable=True)
     content = Column(Text, nullable=False)
+    content_ru = Column(Text, nullable=True)
+    content_en = Column(Text, nullable=True)
     image = Column(String, nullable=True)
     is_published = Column(Boolean, default=True)
+    publish_at = Column(DateTime(timezone=True), nullable=True)
+    expire_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __visibility_flag__ = "is_published"
+    __table_args__ = (
+        Index("ix_news_created_at", "created_at", postgresql_where=deleted_at.is_(None)),
+        Index("ix_news_published_created_at", "created_at", postgresql_where=is_published & deleted_at.is_(None)),
+        Index("ix_news_publish_at", "publish_at", postgresql_where=publish_at.isnot(None)),
+        Index("ix_news_expire_at", "expire_at", postgresql_where=expire_at.isnot(None)),
+        Index("ix_news_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
 
 class Meeting(Base):
     __tablename__ = "meetings"
+    __file_columns__ = ("attachment",)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -35,13 +72,26 @@ class Meeting(Base):
     attachment = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_meetings_meeting_date_created_at", meeting_date.desc().nullslast(), created_at.desc(), postgresql_where=deleted_at.is_(None)).ddl_if(dialect="postgresql"),
+        Index("ix_meetings_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
 
 class AntiCorruption(Base):
     __tablename__ = "anti_corruption"
+    __file_columns__ = ("document",)
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     content = Column(Text, nullable=False)
     document = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_anti_corruption_created_at", "created_at", postgresql_where=deleted_at.is_(None)),
+        Index("ix_anti_corruption_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
\ No newline at end of file
@@ -1,71 +1,254 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+import re
+from sqlalchemy import (
+    Column, Integer, String, Text, DateTime, JSON, Index, Boolean, ForeignKey, UniqueConstraint, event, inspect
+)
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from core.database import Base
+from core.database import Base, SessionLocal
+from core.i18n import trigram_indexes
+
+SORT_KEY_PART = re.compile(r"\d+|[^\W\d_]+")
+APOSTROPHES = re.compile(r"[ʻʼ‘’`']")
+
+def natural_sort_key(value):
+    """Words casefolded and numbers length-prefixed, so "ShNQ 2.01.2"
+    ("shnq 01 2 01 1 01 2") sorts before "ShNQ 2.01.10"."""
+    if value is None:
+        return None
+    parts = []
+    for part in SORT_KEY_PART.findall(APOSTROPHES.sub("", value.casefold())):
+        if part.isdigit():
+            part = part.lstrip("0") or "0"
+            part = f"{len(part):02d} {part}"
+        parts.append(part)
+    return " ".join(parts)
+
+def sort_key_column(source: str):
+    # Byte order on PostgreSQL, where locale collations skip spaces; set on
+    # insert here (ORM and Core alike) and on update by _refresh_sort_keys
+    return Column(
+        String().with_variant(String(collation="C"), "postgresql"), nullable=True,
+        default=lambda context: natural_sort_key(context.get_current_parameters().get(source))
+    )
 
 class ConstructionNorm(Base):
     __tablename__ = "construction_norms"
+    __translated__ = ("title",)
+    __file_columns__ = ("link",)
 
     id = Column(Integer, primary_key=True, index=True)
     subsystem = Column(String, nullable=False)
     group = Column(String, nullable=False)
-    code = Column(String, nullable=False, unique=True)
+    code = Column(String, nullable=False)
+    code_sort_key = sort_key_column("code")
     title = Column(String, nullable=False)
+    title_ru = Column(String, nullable=True)
+    title_en = Column(String, nullable=True)
     link = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Codes are unique among live rows only, so a deleted document's code
+    # can be reused before the purger removes it
+    __table_args__ = (
+        Index("uq_construction_norms_code", "code", unique=True, postgresql_where=deleted_at.is_(None), sqlite_where=deleted_at.is_(None)),
+        Index("ix_construction_norms_subsystem_group_code_sort_key", "subsystem", "group", "code_sort_key", postgresql_where=deleted_at.is_(None)),
+        Index("ix_construction_norms_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
 
 class Standard(Base):
     __tablename__ = "standards"
+    __translated__ = ("title", "description")
+    __file_columns__ = ("link",)
 
     id = Column(Integer, primary_key=True, index=True)
-    code = Column(String, nullable=False, unique=True)
+    code = Column(String, nullable=False)
+    code_sort_key = sort_key_column("code")
     title = Column(String, nullable=False)
+    title_ru = Column(String, nullable=True)
+    title_en = Column(String, nullable=True)
     description = Column(Text, nullable=True)
+    description_ru = Column(Text, nullable=True)
+    description_en = Column(Text, nullable=True)
     link = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("uq_standards_code", "code", unique=True, postgresql_where=deleted_at.is_(None), sqlite_where=deleted_at.is_(None)),
+        *trigram_indexes("standards", "title"),
+        Index("ix_standards_code_sort_key", "code_sort_key", postgresql_where=deleted_at.is_(None)),
+        Index("ix_standards_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
 
 class BuildingRegulation(Base):
     __tablename__ = "building_regulations"
+    __translated__ = ("title",)
+    __file_columns__ = ("link",)
 
     id = Column(Integer, primary_key=True, index=True)
     number = Column(String, nullable=False)
-    code = Column(String, nullable=False, unique=True)
+    number_sort_key = sort_key_column("number")
+    code = Column(String, nullable=False)
     title = Column(String, nullable=False)
+    title_ru = Column(String, nullable=True)
+    title_en = Column(String, nullable=True)
     link = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("uq_building_regulations_code", "code", unique=True, postgresql_where=deleted_at.is_(None), sqlite_where=deleted_at.is_(None)),
+        *trigram_indexes("building_regulations", "title"),
+        Index("ix_building_regulations_number_sort_key", "number_sort_key", postgresql_where=deleted_at.is_(None)),
+        Index("ix_building_regulations_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
 
 class CostResourceNorm(Base):
     __tablename__ = "cost_resource_norms"
+    __translated__ = ("srn_title", "main_shnq_title")
+    __file_columns__ = ("file",)
 
     id = Column(Integer, primary_key=True, index=True)
-    srn_code = Column(String, nullable=False, unique=True)
+    srn_code = Column(String, nullable=False)
+    srn_code_sort_key = sort_key_column("srn_code")
     srn_title = Column(String, nullable=False)
+    srn_title_ru = Column(String, nullable=True)
+    srn_title_en = Column(String, nullable=True)
     main_shnq_code = Column(String, nullable=False)
     main_shnq_title = Column(String, nullable=False)
+    main_shnq_title_ru = Column(String, nullable=True)
+    main_shnq_title_en = Column(String, nullable=True)
     additional_shnqs = Column(JSON, nullable=True)
     file = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("uq_cost_resource_norms_srn_code", "srn_code", unique=True, postgresql_where=deleted_at.is_(None), sqlite_where=deleted_at.is_(None)),
+        *trigram_indexes("cost_resource_norms", "srn_title"),
+        Index("ix_cost_resource_norms_srn_code_sort_key", "srn_code_sort_key", postgresql_where=deleted_at.is_(None)),
+        Index("ix_cost_resource_norms_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
+
+    # Kept in step with main_shnq_code and additional_shnqs by _sync_shnq_links
+    shnq_links = relationship("CostResourceNormShnq", cascade="all, delete-orphan")
+
+    def sync_shnq_links(self):
+        # Rows for codes that stay are updated in place, since the unit of
+        # work inserts before it deletes and would trip the unique constraint
+        existing = {link.shnq_code: link for link in self.shnq_links}
+        links = []
+        for entry in shnq_links(self.main_shnq_code, self.main_shnq_title, self.additional_shnqs):
+            link = existing.get(entry["shnq_code"]) or CostResourceNormShnq(shnq_code=entry["shnq_code"])
+            link.shnq_title = entry["shnq_title"]
+            link.is_main = entry["is_main"]
+            links.append(link)
+        self.shnq_links = links
+
+def shnq_links(main_code, main_title, additional) -> list:
+    """Link rows for a cost resource norm, main ShNQ first, one per code."""
+    entries = [{"code": main_code, "title": main_title}] + list(additional or [])
+    links = {}
+    for position, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            entry = {"code": entry}
+        code = str(entry.get("code") or "").strip()
+        if code and code not in links:
+            links[code] = {"shnq_code": code, "shnq_title": entry.get("title"), "is_main": position == 0}
+    return list(links.values())
+
+class CostResourceNormShnq(Base):
+    __tablename__ = "cost_resource_norm_shnqs"
+
+    id = Column(Integer, primary_key=True)
+    cost_resource_norm_id = Column(Integer, ForeignKey("cost_resource_norms.id", ondelete="CASCADE"), nullable=False)
+    shnq_code = Column(String, nullable=False)
+    shnq_title = Column(String, nullable=True)
+    is_main = Column(Boolean, nullable=False, default=False)
+
+    __table_args__ = (
+        UniqueConstraint("cost_resource_norm_id", "shnq_code", name="uq_cost_resource_norm_shnqs_norm_code"),
+        Index("ix_cost_resource_norm_shnqs_shnq_code", "shnq_code", "cost_resource_norm_id"),
+    )
 
 class TechnicalRegulation(Base):
     __tablename__ = "technical_regulations"
+    __translated__ = ("title", "description")
+    __file_columns__ = ("link",)
 
     id = Column(Integer, primary_key=True, index=True)
-    code = Column(String, nullable=False, unique=True)
+    code = Column(String, nullable=False)
+    code_sort_key = sort_key_column("code")
     title = Column(String, nullable=False)
+    title_ru = Column(String, nullable=True)
+    title_en = Column(String, nullable=True)
     description = Column(Text, nullable=True)
+    description_ru = Column(Text, nullable=True)
+    description_en = Column(Text, nullable=True)
     link = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("uq_technical_regulations_code", "code", unique=True, postgresql_where=deleted_at.is_(None), sqlite_where=deleted_at.is_(None)),
+        *trigram_indexes("technical_regulations", "title"),
+        Index("ix_technical_regulations_code_sort_key", "code_sort_key", postgresql_where=deleted_at.is_(None)),
+        Index("ix_technical_regulations_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
 
 class Reference(Base):
     __tablename__ = "references"
+    __translated__ = ("title",)
+    __file_columns__ = ("link",)
 
     id = Column(Integer, primary_key=True, index=True)
     number = Column(String, nullable=False)
+    number_sort_key = sort_key_column("number")
     title = Column(String, nullable=False)
+    title_ru = Column(String, nullable=True)
+    title_en = Column(String, nullable=True)
     link = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        *trigram_indexes("references", "title"),
+        Index("ix_references_number_sort_key", "number_sort_key", postgresql_where=deleted_at.is_(None)),
+        Index("ix_references_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+    )
+
+SHNQ_FIELDS = ("main_shnq_code", "main_shnq_title", "additional_shnqs")
+
+@event.listens_for(SessionLocal, "before_flush")
+def _sync_shnq_links(session, flush_context, instances):
+    for obj in list(session.new) + list(session.dirty):
+        if not isinstance(obj, CostResourceNorm):
+            continue
+        state = inspect(obj)
+        if state.pending or any(state.attrs[field].history.has_changes() for field in SHNQ_FIELDS):
+            obj.sync_shnq_links()
+
+SORT_KEYS = {
+    ConstructionNorm: {"code": "code_sort_key"},
+    Standard: {"code": "code_sort_key"},
+    BuildingRegulation: {"number": "number_sort_key"},
+    CostResourceNorm: {"srn_code": "srn_code_sort_key"},
+    TechnicalRegulation: {"code": "code_sort_key"},
+    Reference: {"number": "number_sort_key"},
+}
+
+def _refresh_sort_keys(mapper, connection, target):
+    state = inspect(target)
+    for source, key in SORT_KEYS[mapper.class_].items():
+        if state.attrs[source].history.has_changes():
+            setattr(target, key, natural_sort_key(getattr(target, source)))
+
+for _model in SORT_KEYS:
+    event.listen(_model, "before_update", _refresh_sort_keys)
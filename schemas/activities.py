@@ -21,4 +21,14 @@ class ManagementSystemResponse(ManagementSystemBase):
     updated_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ManagementSystemListItem(BaseModel):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    pdf: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+MANAGEMENT_SYSTEM_SUMMARY_FIELDS = ["id", "title", "pdf", "created_at", "updated_at"]
\ No newline at end of file
@@ -7,11 +7,14 @@ class AboutBase(BaseModel):
     pdf_url: Optional[str] = None
 
 class AboutCreate(AboutBase):
-    pass
+    content_ru: Optional[str] = None
+    content_en: Optional[str] = None
 
 class AboutUpdate(BaseModel):
     content: Optional[str] = None
     pdf_url: Optional[str] = None
+    content_ru: Optional[str] = None
+    content_en: Optional[str] = None
 
 class AboutResponse(AboutBase):
     id: int
@@ -104,9 +107,16 @@ class VacancyBase(BaseModel):
     contact_email: EmailStr
     attachment: Optional[str] = None
     is_active: bool = True
+    publish_at: Optional[datetime] = None
+    expire_at: Optional[datetime] = None
 
 class VacancyCreate(VacancyBase):
-    pass
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
+    description_ru: Optional[str] = None
+    description_en: Optional[str] = None
+    requirements_ru: Optional[str] = None
+    requirements_en: Optional[str] = None
 
 class VacancyUpdate(BaseModel):
     title: Optional[str] = None
@@ -116,6 +126,14 @@ class VacancyUpdate(BaseModel):
     contact_email: Optional[EmailStr] = None
     attachment: Optional[str] = None
     is_active: Optional[bool] = None
+    publish_at: Optional[datetime] = None
+    expire_at: Optional[datetime] = None
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
+    description_ru: Optional[str] = None
+    description_en: Optional[str] = None
+    requirements_ru: Optional[str] = None
+    requirements_en: Optional[str] = None
 
 class VacancyResponse(VacancyBase):
     id: int
@@ -123,4 +141,20 @@ class VacancyResponse(VacancyBase):
     updated_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class VacancyListItem(BaseModel):
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    requirements: Optional[str] = None
+    deadline: Optional[datetime] = None
+    contact_email: Optional[str] = None
+    attachment: Optional[str] = None
+    is_active: Optional[bool] = None
+    publish_at: Optional[datetime] = None
+    expire_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+VACANCY_SUMMARY_FIELDS = ["id", "title", "deadline", "contact_email", "attachment", "is_active", "created_at", "updated_at"]
\ No newline at end of file
@@ -7,15 +7,26 @@ class AnnouncementBase(BaseModel):
     content: str
     attachment: Optional[str] = None
     is_active: bool = True
+    publish_at: Optional[datetime] = None
+    expire_at: Optional[datetime] = None
 
 class AnnouncementCreate(AnnouncementBase):
-    pass
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
+    content_ru: Optional[str] = None
+    content_en: Optional[str] = None
 
 class AnnouncementUpdate(BaseModel):
     title: Optional[str] = None
     content: Optional[str] = None
     attachment: Optional[str] = None
     is_active: Optional[bool] = None
+    publish_at: Optional[datetime] = None
+    expire_at: Optional[datetime] = None
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
+    content_ru: Optional[str] = None
+    content_en: Optional[str] = None
 
 class AnnouncementResponse(AnnouncementBase):
     id: int
@@ -25,20 +36,44 @@ class AnnouncementResponse(AnnouncementBase):
     class Config:
         from_attributes = True
 
+class AnnouncementListItem(BaseModel):
+    id: int
+    title: Optional[str] = None
+    content: Optional[str] = None
+    attachment: Optional[str] = None
+    is_active: Optional[bool] = None
+    publish_at: Optional[datetime] = None
+    expire_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+ANNOUNCEMENT_SUMMARY_FIELDS = ["id", "title", "attachment", "is_active", "created_at", "updated_at"]
+
 class NewsBase(BaseModel):
     title: str
     content: str
     image: Optional[str] = None
     is_published: bool = True
+    publish_at: Optional[datetime] = None
+    expire_at: Optional[datetime] = None
 
 class NewsCreate(NewsBase):
-    pass
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
+    content_ru: Optional[str] = None
+    content_en: Optional[str] = None
 
 class NewsUpdate(BaseModel):
     title: Optional[str] = None
     content: Optional[str] = None
     image: Optional[str] = None
     is_published: Optional[bool] = None
+    publish_at: Optional[datetime] = None
+    expire_at: Optional[datetime] = None
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
+    content_ru: Optional[str] = None
+    content_en: Optional[str] = None
 
 class NewsResponse(NewsBase):
     id: int
@@ -48,6 +83,19 @@ class NewsResponse(NewsBase):
     class Config:
         from_attributes = True
 
+class NewsListItem(BaseModel):
+    id: int
+    title: Optional[str] = None
+    content: Optional[str] = None
+    image: Optional[str] = None
+    is_published: Optional[bool] = None
+    publish_at: Optional[datetime] = None
+    expire_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+NEWS_SUMMARY_FIELDS = ["id", "title", "image", "is_published", "created_at", "updated_at"]
+
 class MeetingBase(BaseModel):
     title: str
     content: str
@@ -73,6 +121,18 @@ class MeetingResponse(MeetingBase):
     class Config:
         from_attributes = True
 
+class MeetingListItem(BaseModel):
+    id: int
+    title: Optional[str] = None
+    content: Optional[str] = None
+    meeting_date: Optional[datetime] = None
+    location: Optional[str] = None
+    attachment: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+MEETING_SUMMARY_FIELDS = ["id", "title", "meeting_date", "location", "attachment", "created_at", "updated_at"]
+
 class AntiCorruptionBase(BaseModel):
     title: str
     content: str
@@ -92,4 +152,14 @@ class AntiCorruptionResponse(AntiCorruptionBase):
     updated_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class AntiCorruptionListItem(BaseModel):
+    id: int
+    title: Optional[str] = None
+    content: Optional[str] = None
+    document: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+ANTI_CORRUPTION_SUMMARY_FIELDS = ["id", "title", "document", "created_at", "updated_at"]
\ No newline at end of file
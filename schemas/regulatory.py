@@ -10,7 +10,8 @@ class ConstructionNormBase(BaseModel):
     link: Optional[str] = None
 
 class ConstructionNormCreate(ConstructionNormBase):
-    pass
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
 
 class ConstructionNormUpdate(BaseModel):
     subsystem: Optional[str] = None
@@ -18,6 +19,8 @@ class ConstructionNormUpdate(BaseModel):
     code: Optional[str] = None
     title: Optional[str] = None
     link: Optional[str] = None
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
 
 class ConstructionNormResponse(ConstructionNormBase):
     id: int
@@ -27,6 +30,26 @@ class ConstructionNormResponse(ConstructionNormBase):
     class Config:
         from_attributes = True
 
+class ConstructionNormTreeNorm(BaseModel):
+    id: int
+    code: str
+    title: str
+    link: Optional[str] = None
+
+class ConstructionNormTreeGroup(BaseModel):
+    name: str
+    count: int
+    norms: Optional[List[ConstructionNormTreeNorm]] = None
+
+class ConstructionNormTreeSubsystem(BaseModel):
+    name: str
+    count: int
+    groups: List[ConstructionNormTreeGroup]
+
+class ConstructionNormTree(BaseModel):
+    total: int
+    subsystems: List[ConstructionNormTreeSubsystem]
+
 class StandardBase(BaseModel):
     code: str
     title: str
@@ -34,13 +57,20 @@ class StandardBase(BaseModel):
     link: Optional[str] = None
 
 class StandardCreate(StandardBase):
-    pass
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
+    description_ru: Optional[str] = None
+    description_en: Optional[str] = None
 
 class StandardUpdate(BaseModel):
     code: Optional[str] = None
     title: Optional[str] = None
     description: Optional[str] = None
     link: Optional[str] = None
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
+    description_ru: Optional[str] = None
+    description_en: Optional[str] = None
 
 class StandardResponse(StandardBase):
     id: int
@@ -50,6 +80,17 @@ class StandardResponse(StandardBase):
     class Config:
         from_attributes = True
 
+class StandardListItem(BaseModel):
+    id: int
+    code: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    link: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+STANDARD_SUMMARY_FIELDS = ["id", "code", "title", "link", "created_at", "updated_at"]
+
 class BuildingRegulationBase(BaseModel):
     number: str
     code: str
@@ -57,13 +98,16 @@ class BuildingRegulationBase(BaseModel):
     link: Optional[str] = None
 
 class BuildingRegulationCreate(BuildingRegulationBase):
-    pass
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
 
 class BuildingRegulationUpdate(BaseModel):
     number: Optional[str] = None
     code: Optional[str] = None
     title: Optional[str] = None
     link: Optional[str] = None
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
 
 class BuildingRegulationResponse(BuildingRegulationBase):
     id: int
@@ -82,7 +126,10 @@ class CostResourceNormBase(BaseModel):
     file: Optional[str] = None
 
 class CostResourceNormCreate(CostResourceNormBase):
-    pass
+    srn_title_ru: Optional[str] = None
+    srn_title_en: Optional[str] = None
+    main_shnq_title_ru: Optional[str] = None
+    main_shnq_title_en: Optional[str] = None
 
 class CostResourceNormUpdate(BaseModel):
     srn_code: Optional[str] = None
@@ -91,6 +138,10 @@ class CostResourceNormUpdate(BaseModel):
     main_shnq_title: Optional[str] = None
     additional_shnqs: Optional[List[Dict[str, Any]]] = None
     file: Optional[str] = None
+    srn_title_ru: Optional[str] = None
+    srn_title_en: Optional[str] = None
+    main_shnq_title_ru: Optional[str] = None
+    main_shnq_title_en: Optional[str] = None
 
 class CostResourceNormResponse(CostResourceNormBase):
     id: int
@@ -107,13 +158,20 @@ class TechnicalRegulationBase(BaseModel):
     link: Optional[str] = None
 
 class TechnicalRegulationCreate(TechnicalRegulationBase):
-    pass
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
+    description_ru: Optional[str] = None
+    description_en: Optional[str] = None
 
 class TechnicalRegulationUpdate(BaseModel):
     code: Optional[str] = None
     title: Optional[str] = None
     description: Optional[str] = None
     link: Optional[str] = None
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
+    description_ru: Optional[str] = None
+    description_en: Optional[str] = None
 
 class TechnicalRegulationResponse(TechnicalRegulationBase):
     id: int
@@ -123,18 +181,32 @@ class TechnicalRegulationResponse(TechnicalRegulationBase):
     class Config:
         from_attributes = True
 
+class TechnicalRegulationListItem(BaseModel):
+    id: int
+    code: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    link: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+TECHNICAL_REGULATION_SUMMARY_FIELDS = ["id", "code", "title", "link", "created_at", "updated_at"]
+
 class ReferenceBase(BaseModel):
     number: str
     title: str
     link: Optional[str] = None
 
 class ReferenceCreate(ReferenceBase):
-    pass
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
 
 class ReferenceUpdate(BaseModel):
     number: Optional[str] = None
     title: Optional[str] = None
     link: Optional[str] = None
+    title_ru: Optional[str] = None
+    title_en: Optional[str] = None
 
 class ReferenceResponse(ReferenceBase):
     id: int
@@ -142,4 +214,32 @@ class ReferenceResponse(ReferenceBase):
     updated_at: Optional[datetime] = None
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ReferenceNode(BaseModel):
+    kind: str
+    id: int
+    code: str
+    title: str
+    depth: Optional[int] = None
+
+class DocumentReferences(BaseModel):
+    document: ReferenceNode
+    references: List[ReferenceNode]
+    unresolved: List[str]
+
+class DocumentReferencedBy(BaseModel):
+    document: ReferenceNode
+    referenced_by: List[ReferenceNode]
+
+class DocumentDependencies(BaseModel):
+    document: ReferenceNode
+    direction: str
+    dependencies: List[ReferenceNode]
+
+class SuggestItem(BaseModel):
+    kind: str
+    id: int
+    code: str
+    title: str
+    match: str
@@ -0,0 +1,65 @@
+"""Shared fixtures.
+
+    TEST_DATABASE_URL=postgresql://localhost/tmsiti_test python -m pytest
+
+Settings are read on import, so the app is pointed at TEST_DATABASE_URL
+(a temporary SQLite file when unset) before anything else is imported.
+Never point it at a database whose data matters: the schema is migrated
+and rows are written. Tests that need PostgreSQL skip on SQLite.
+"""
+import os
+import tempfile
+
+_scratch = tempfile.mkdtemp(prefix="tmsiti-tests-")
+os.environ["DATABASE_URL"] = os.environ.get("TEST_DATABASE_URL") or f"sqlite:///{_scratch}/test.db"
+os.environ["UPLOAD_DIR"] = os.path.join(_scratch, "uploads")
+os.environ["PUBLISHING_SCHEDULER_ENABLED"] = "false"
+os.environ["PURGER_ENABLED"] = "false"
+os.environ["ACCESS_LOG_ENABLED"] = "false"
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from fastapi.testclient import TestClient
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADMIN_EMAIL = "tests@tmsiti.uz"
+
+@pytest.fixture(scope="session")
+def migrated():
+    config = Config(os.path.join(ROOT, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(ROOT, "migrations"))
+    command.upgrade(config, "head")
+
+@pytest.fixture(scope="session")
+def client(migrated):
+    from main import app
+
+    with TestClient(app) as client:
+        yield client
+
+@pytest.fixture
+def db(migrated):
+    from core.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+@pytest.fixture(scope="session")
+def admin_headers(migrated):
+    from core.database import SessionLocal
+    from core.security import create_access_token, get_password_hash
+    from models.user import User
+
+    db = SessionLocal()
+    try:
+        if not db.query(User).filter(User.email == ADMIN_EMAIL).first():
+            db.add(User(email=ADMIN_EMAIL, hashed_password=get_password_hash("tests"),
+                        full_name="Tests Admin", is_admin=True, is_active=True))
+            db.commit()
+    finally:
+        db.close()
+    return {"Authorization": f"Bearer {create_access_token({'sub': ADMIN_EMAIL})}"}
@@ -0,0 +1,24 @@
+"""Audit records name what happened to a row, soft deletes included."""
+from datetime import datetime, timedelta, timezone
+import pytest
+from core.audit import audit_writer
+from core.soft_delete import purge_deleted
+
+@pytest.fixture
+def audited(monkeypatch):
+    records = []
+    monkeypatch.setattr(audit_writer, "submit", records.extend)
+    return records
+
+def actions(records, entity, entity_id):
+    return [record["action"] for record in records if record["entity"] == entity and record["entity_id"] == str(entity_id)]
+
+def test_soft_delete_and_purge_are_recorded(client, admin_headers, db, audited):
+    item = client.post("/api/v1/news/anti-corruption", headers=admin_headers, json={
+        "title": "Hisobot", "content": "Matn"
+    }).json()
+    client.put(f"/api/v1/news/anti-corruption/{item['id']}", headers=admin_headers, json={"title": "Yillik hisobot"})
+    client.delete(f"/api/v1/news/anti-corruption/{item['id']}", headers=admin_headers)
+    purge_deleted(db, datetime.now(timezone.utc) + timedelta(seconds=1))
+
+    assert actions(audited, "anti_corruption", item["id"]) == ["create", "update", "delete", "purge"]
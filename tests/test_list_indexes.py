@@ -0,0 +1,56 @@
+"""The list endpoints' queries are answered from the indexes made for them.
+
+Each endpoint is called and the EXPLAIN of the page query it ran is checked
+for its index. Sequential scans are disabled for the EXPLAIN, since on a
+near-empty table the planner would rightly prefer one.
+"""
+import pytest
+from sqlalchemy import event
+from core.database import engine
+
+pytestmark = pytest.mark.skipif(engine.dialect.name != "postgresql", reason="EXPLAIN plans need PostgreSQL")
+
+LIST_QUERIES = [
+    ("/api/v1/news/announcements", {}, "ix_announcements_active_created_at"),
+    ("/api/v1/news/announcements", {"active_only": "false"}, "ix_announcements_created_at"),
+    ("/api/v1/news/news", {}, "ix_news_published_created_at"),
+    ("/api/v1/news/news", {"published_only": "false", "page": "3"}, "ix_news_created_at"),
+    ("/api/v1/news/meetings", {}, "ix_meetings_meeting_date_created_at"),
+    ("/api/v1/news/anti-corruption", {}, "ix_anti_corruption_created_at"),
+    ("/api/v1/institute/management", {}, "ix_management_order_index_created_at"),
+    ("/api/v1/institute/structural-divisions", {}, "ix_structural_divisions_created_at"),
+    ("/api/v1/institute/vacancies", {}, "ix_vacancies_active_created_at"),
+    ("/api/v1/institute/vacancies", {"active_only": "false"}, "ix_vacancies_created_at"),
+    ("/api/v1/activities/management-systems", {"fields": "*"}, "ix_management_systems_created_at"),
+    ("/api/v1/regulatory/construction-norms", {}, "ix_construction_norms_subsystem_group_code_sort_key"),
+    ("/api/v1/regulatory/construction-norms", {"subsystem": "1", "group": "2"}, "ix_construction_norms_subsystem_group_code_sort_key"),
+    ("/api/v1/regulatory/standards", {}, "ix_standards_code_sort_key"),
+    ("/api/v1/regulatory/building-regulations", {"size": "50"}, "ix_building_regulations_number_sort_key"),
+    ("/api/v1/regulatory/cost-resource-norms", {}, "ix_cost_resource_norms_srn_code_sort_key"),
+    ("/api/v1/regulatory/technical-regulations", {}, "ix_technical_regulations_code_sort_key"),
+    ("/api/v1/regulatory/references", {}, "ix_references_number_sort_key"),
+]
+
+def page_query(client, path, params):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if " LIMIT " in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        response = client.get(path, params=params)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert response.status_code == 200, response.text
+    assert len(statements) == 1
+    return statements[0]
+
+@pytest.mark.parametrize("path, params, index", LIST_QUERIES)
+def test_list_query_uses_index(client, path, params, index):
+    statement, parameters = page_query(client, path, params)
+    with engine.connect() as connection:
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        plan = "\n".join(connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).scalars())
+    assert index in plan, plan
@@ -0,0 +1,63 @@
+"""Writes reach the in-memory indexes as they commit, without a rebuild."""
+import random
+import pytest
+from utils.norm_tree import norm_tree
+from utils.reference_graph import reference_graph
+from utils.suggest import suggest_index
+
+API = "/api/v1/regulatory"
+
+def tree_norms(client):
+    tree = client.get(f"{API}/construction-norms/tree").json()
+    return {
+        norm["id"]: norm
+        for subsystem in tree["subsystems"] for group in subsystem["groups"] for norm in group["norms"]
+    }
+
+def suggested_ids(client, query):
+    return {item["id"] for item in client.get(f"{API}/suggest", params={"q": query}).json()}
+
+def referrer_ids(client, standard_id):
+    response = client.get(f"{API}/graph/standards/{standard_id}/referenced-by")
+    return {node["id"] for node in response.json()["referenced_by"]}
+
+@pytest.fixture
+def no_rebuilds(monkeypatch):
+    def fail(db):
+        raise AssertionError("index rebuilt instead of updated")
+
+    def forbid():
+        for index in (norm_tree, suggest_index, reference_graph):
+            monkeypatch.setattr(index, "rebuild", fail)
+    return forbid
+
+def test_update_and_soft_delete_reach_indexes(client, admin_headers, no_rebuilds):
+    number = random.randrange(10 ** 6)
+    standard_code = f"O'z DSt {number}:2026"
+    standard = client.post(f"{API}/standards", headers=admin_headers, json={
+        "code": standard_code, "title": "Beton sinov usullari"
+    }).json()
+    norm = client.post(f"{API}/construction-norms", headers=admin_headers, json={
+        "subsystem": "1. Umumiy", "group": "01", "code": f"ShNQ 9.{number}-2026",
+        "title": f"Qurilish normasi, {standard_code} asosida", "title_ru": f"Norma {number}"
+    }).json()
+
+    # Loaded from the database once; from here on only commits move them
+    assert tree_norms(client)[norm["id"]]["title"] == norm["title"]
+    assert norm["id"] in suggested_ids(client, norm["code"])
+    assert norm["id"] in referrer_ids(client, standard["id"])
+    no_rebuilds()
+
+    response = client.put(f"{API}/construction-norms/{norm['id']}", headers=admin_headers, json={
+        "group": "02", "title": "Yangilangan normasi", "title_ru": None
+    })
+    assert response.status_code == 200
+    assert tree_norms(client)[norm["id"]]["title"] == "Yangilangan normasi"
+    assert norm["id"] in suggested_ids(client, "yangilangan")
+    assert norm["id"] not in referrer_ids(client, standard["id"])
+
+    response = client.delete(f"{API}/construction-norms/{norm['id']}", headers=admin_headers)
+    assert response.status_code == 200
+    assert norm["id"] not in tree_norms(client)
+    assert norm["id"] not in suggested_ids(client, norm["code"])
+    assert client.get(f"{API}/graph/construction-norms/{norm['id']}/references").status_code == 404
@@ -0,0 +1,44 @@
+"""Uploads linked only from rich text are never taken for orphans."""
+import os
+from datetime import datetime, timedelta, timezone
+from core.config import settings
+from core.soft_delete import purge_deleted, reconcile_uploads, sweep_orphan_files
+from models.news import News
+
+def upload(client, admin_headers, name):
+    response = client.post(
+        "/api/v1/news/upload/image", headers=admin_headers, files={"file": (name, b"\x89PNG", "image/png")}
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["url"]
+
+def on_disk(url):
+    return os.path.exists(os.path.join(settings.UPLOAD_DIR, url[len("/uploads/"):]))
+
+def test_sweep_keeps_embedded_uploads_and_only_reports(client, admin_headers, db):
+    embedded = upload(client, admin_headers, "inline.png")
+    orphan = upload(client, admin_headers, "unused.png")
+    client.post("/api/v1/news/news", headers=admin_headers, json={
+        "title": "Rasmli yangilik", "content": f'<p><img src="https://tmsiti.uz{embedded}"></p>'
+    })
+
+    orphans, _ = reconcile_uploads(db, min_age_seconds=0)
+    assert orphan[len("/uploads/"):] in orphans
+    assert embedded[len("/uploads/"):] not in orphans
+
+    sweep_orphan_files(db, min_age_seconds=0)
+    assert on_disk(orphan)
+
+def test_purge_keeps_files_still_linked_from_text(client, admin_headers, db):
+    shared = upload(client, admin_headers, "shared.png")
+    item = client.post("/api/v1/news/news", headers=admin_headers, json={
+        "title": "Eski yangilik", "content": "Matn", "image": shared
+    }).json()
+    client.post("/api/v1/news/news", headers=admin_headers, json={
+        "title": "Yangi yangilik", "content": f'<img src="{shared}">'
+    })
+    assert client.delete(f"/api/v1/news/news/{item['id']}", headers=admin_headers).status_code == 200
+
+    purge_deleted(db, datetime.now(timezone.utc) + timedelta(seconds=1))
+    assert db.query(News).execution_options(include_deleted=True).filter(News.id == item["id"]).first() is None
+    assert on_disk(shared)
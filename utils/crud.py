@@ -0,0 +1,194 @@
+import inspect
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Type
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from core.database import get_db
+from core.i18n import DEFAULT_LOCALE, is_translated, localized_columns, localized_search
+from core.publishing import visible
+from core.soft_delete import soft_delete
+from schemas.common import PaginatedResponse
+from utils.dependencies import get_admin_user, get_optional_admin_user, cache_control, get_locale
+from utils.pagination import paginate
+from utils.projection import parse_fields
+
+class ListFilter(NamedTuple):
+    """A list query parameter; `condition(value)` gives a WHERE clause or None."""
+    annotation: Any
+    default: Any
+    condition: Callable[[Any], Any]
+
+def visibility_filter(model) -> ListFilter:
+    # active_only / published_only, on by default
+    return ListFilter(bool, Query(True), lambda value: visible(model) if value else None)
+
+def contains_filter(column) -> ListFilter:
+    return ListFilter(Optional[str], Query(None), lambda value: column.ilike(f"%{value}%") if value else None)
+
+def _default_locale() -> str:
+    return DEFAULT_LOCALE
+
+def _list_params(filters: Dict[str, ListFilter], searchable: bool, projectable: bool):
+    # One dependency carrying every optional list parameter, so the
+    # endpoint signature FastAPI reads can vary per entity
+    parameters = []
+    if searchable:
+        parameters.append(inspect.Parameter("search", inspect.Parameter.KEYWORD_ONLY, default=Query(None), annotation=Optional[str]))
+    for name, spec in filters.items():
+        parameters.append(inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=spec.default, annotation=spec.annotation))
+    if projectable:
+        parameters.append(inspect.Parameter(
+            "fields", inspect.Parameter.KEYWORD_ONLY, annotation=Optional[str],
+            default=Query(None, description="Comma-separated list of fields, or * for all")
+        ))
+
+    def list_params(**values):
+        return values
+
+    list_params.__signature__ = inspect.Signature(parameters)
+    return list_params
+
+def crud_routes(
+    router: APIRouter,
+    path: str,
+    model,
+    *,
+    name: str,
+    slug: str,
+    response_schema: Type[BaseModel],
+    create_schema: Type[BaseModel],
+    update_schema: Type[BaseModel],
+    list_schema: Optional[Type[BaseModel]] = None,
+    summary_fields: Optional[Sequence[str]] = None,
+    order_by: Sequence = (),
+    search: Sequence[str] = (),
+    filters: Optional[Dict[str, ListFilter]] = None,
+    lookup: Optional[str] = None,
+    paginated: bool = True,
+):
+    """Register list, detail, create, update and delete routes for `model` under `path`.
+
+    name: singular for messages ("Standard not found"); slug: endpoint
+    names (get_<slug>, create_<slug>, ...). Lists are ordered by order_by,
+    match `?search=` against the `search` columns (every locale for
+    translated ones) and are projected through `?fields=` when
+    summary_fields is given. Translated models are served in the request
+    locale. `lookup` adds GET <path>/by-code/{value} on that column.
+    Unpublished or expired items of publishable models are only shown to
+    admins. Deleting soft deletes; routes matching <path>/<word> (such as a
+    tree) must be registered before these.
+    """
+    filters = filters or {}
+    locale_dependency = get_locale if is_translated(model) else _default_locale
+    list_params = _list_params(filters, bool(search), summary_fields is not None)
+    not_found = f"{name} not found"
+    publishable = hasattr(model, "__visibility_flag__")
+
+    def get_item(db: Session, condition, locale: str):
+        item = db.query(*localized_columns(model, locale)).filter(condition).first()
+        if not item:
+            raise HTTPException(status_code=404, detail=not_found)
+        return item
+
+    def get_instance(db: Session, item_id: int):
+        instance = db.query(model).filter(model.id == item_id).first()
+        if not instance:
+            raise HTTPException(status_code=404, detail=not_found)
+        return instance
+
+    def list_items(
+        page: int = Query(1, ge=1),
+        size: int = Query(10, ge=1, le=100),
+        params: dict = Depends(list_params),
+        locale: str = Depends(locale_dependency),
+        db: Session = Depends(get_db)
+    ):
+        query = db.query(model)
+        if params.get("search"):
+            pattern = f"%{params['search']}%"
+            conditions = [localized_search(model, column, locale, pattern) for column in search]
+            query = query.filter(or_(*conditions))
+        for filter_name, spec in filters.items():
+            condition = spec.condition(params[filter_name])
+            if condition is not None:
+                query = query.filter(condition)
+        query = query.order_by(*order_by)
+        fields = parse_fields(params["fields"], model, summary_fields) if summary_fields is not None else None
+        return paginate(query, page, size, fields, locale)
+
+    def list_all(locale: str = Depends(locale_dependency), db: Session = Depends(get_db)):
+        return db.query(*localized_columns(model, locale)).order_by(*order_by).all()
+
+    def read_item(item_id: int, locale: str = Depends(locale_dependency), db: Session = Depends(get_db)):
+        return get_item(db, model.id == item_id, locale)
+
+    def read_publishable_item(
+        item_id: int,
+        response: Response,
+        locale: str = Depends(locale_dependency),
+        db: Session = Depends(get_db),
+        admin = Depends(get_optional_admin_user)
+    ):
+        if admin is None:
+            return get_item(db, (model.id == item_id) & visible(model), locale)
+        # May be a draft; shared caches must not keep it
+        response.headers["Cache-Control"] = "private, no-store"
+        return get_item(db, model.id == item_id, locale)
+
+    def read_item_by_code(value: str, locale: str = Depends(locale_dependency), db: Session = Depends(get_db)):
+        return get_item(db, getattr(model, lookup) == value, locale)
+
+    def create_item(
+        data: create_schema,
+        db: Session = Depends(get_db),
+        current_user = Depends(get_admin_user)
+    ):
+        instance = model(**data.dict())
+        db.add(instance)
+        db.commit()
+        db.refresh(instance)
+        return instance
+
+    def update_item(
+        item_id: int,
+        data: update_schema,
+        db: Session = Depends(get_db),
+        current_user = Depends(get_admin_user)
+    ):
+        instance = get_instance(db, item_id)
+        for field, value in data.dict(exclude_unset=True).items():
+            setattr(instance, field, value)
+        db.commit()
+        db.refresh(instance)
+        return instance
+
+    def delete_item(
+        item_id: int,
+        db: Session = Depends(get_db),
+        current_user = Depends(get_admin_user)
+    ):
+        soft_delete(get_instance(db, item_id))
+        db.commit()
+        return {"message": f"{name} deleted successfully"}
+
+    if paginated:
+        router.add_api_route(
+            path, list_items, methods=["GET"], name=f"list_{slug}",
+            response_model=PaginatedResponse[list_schema or response_schema],
+            response_model_exclude_unset=summary_fields is not None
+        )
+    else:
+        router.add_api_route(path, list_all, methods=["GET"], name=f"list_{slug}", response_model=List[response_schema])
+    if lookup:
+        router.add_api_route(
+            f"{path}/by-code/{{value:path}}", read_item_by_code, methods=["GET"], name=f"get_{slug}_by_code",
+            response_model=response_schema, dependencies=[Depends(cache_control)]
+        )
+    router.add_api_route(
+        f"{path}/{{item_id}}", read_publishable_item if publishable else read_item, methods=["GET"], name=f"get_{slug}",
+        response_model=response_schema, dependencies=[Depends(cache_control)]
+    )
+    router.add_api_route(path, create_item, methods=["POST"], name=f"create_{slug}", response_model=response_schema)
+    router.add_api_route(f"{path}/{{item_id}}", update_item, methods=["PUT"], name=f"update_{slug}", response_model=response_schema)
+    router.add_api_route(f"{path}/{{item_id}}", delete_item, methods=["DELETE"], name=f"delete_{slug}")
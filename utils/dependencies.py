@@ -1,11 +1,15 @@
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer
+from typing import Optional
+from fastapi import Depends, HTTPException, Query, Request, Response, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
+from core.config import settings
 from core.database import get_db
+from core.i18n import LOCALES, negotiate_locale
 from core.security import verify_token
 from models.user import User
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 def get_current_user(token: str = Depends(security), db: Session = Depends(get_db)) -> User:
     email = verify_token(token.credentials)
@@ -21,6 +25,8 @@ def get_current_user(token: str = Depends(security), db: Session = Depends(get_d
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user"
         )
+    # Attributes audit records of this request's writes to the user
+    db.info["audit_user"] = (user.id, user.email)
     return user
 
 def get_admin_user(current_user: User = Depends(get_current_user)) -> User:
@@ -29,4 +35,34 @@ def get_admin_user(current_user: User = Depends(get_current_user)) -> User:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
-    return current_user
\ No newline at end of file
+    return current_user
+
+def get_optional_admin_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    db: Session = Depends(get_db)
+) -> Optional[User]:
+    """The requesting admin, or None for anyone else (an invalid token included)."""
+    if credentials is None:
+        return None
+    try:
+        email = verify_token(credentials.credentials)
+    except HTTPException:
+        return None
+    user = db.query(User).filter(User.email == email).first()
+    if not user or not user.is_active or not user.is_admin:
+        return None
+    return user
+
+def cache_control(response: Response):
+    response.headers["Cache-Control"] = f"public, max-age={settings.CACHE_MAX_AGE}"
+
+def get_locale(
+    request: Request,
+    response: Response,
+    lang: Optional[str] = Query(None, pattern=f"^({'|'.join(LOCALES)})$", description="Overrides Accept-Language")
+) -> str:
+    locale = lang or negotiate_locale(request.headers.get("accept-language"))
+    response.headers["Content-Language"] = locale
+    # Shared caches must keep one copy per language
+    response.headers["Vary"] = "Accept-Language"
+    return locale
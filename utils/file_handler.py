@@ -1,7 +1,9 @@
 import os
+import re
 import shutil
 import uuid
-from typing import Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set, Tuple
 from fastapi import UploadFile, HTTPException
 from core.config import settings
 
@@ -58,12 +60,74 @@ async def save_upload_file(file: UploadFile, folder: str = "general") -> str:
     
     return f"{folder}/{unique_filename}"
 
+def upload_path(value: Optional[str]) -> Optional[str]:
+    """Path under UPLOAD_DIR that a stored file column points at.
+
+    Columns hold either the path save_upload_file returned or the
+    /uploads/... URL handed to clients; external links and anything
+    escaping UPLOAD_DIR give None.
+    """
+    if not value or "://" in value:
+        return None
+    path = value.split("?", 1)[0].lstrip("/")
+    if path.startswith("uploads/"):
+        path = path[len("uploads/"):]
+    path = os.path.normpath(path)
+    if path in (".", "") or path.startswith("..") or os.path.isabs(path):
+        return None
+    return path.replace(os.sep, "/")
+
+# /uploads/... URLs inside rich text, relative or absolute, up to a quote,
+# bracket, whitespace, query string or entity
+EMBEDDED_UPLOAD_URL = re.compile(r"/uploads/[^\s\"'<>()\\?#&]+")
+
+def embedded_upload_paths(text: Optional[str]) -> Set[str]:
+    """Paths under UPLOAD_DIR of the /uploads/... URLs embedded in text."""
+    if not text or "uploads/" not in text:
+        return set()
+    return set(filter(None, map(upload_path, EMBEDDED_UPLOAD_URL.findall(text))))
+
+def _scan_folder(folder: str) -> Tuple[List[Tuple[str, float]], List[str]]:
+    files, folders = [], []
+    try:
+        entries = os.scandir(os.path.join(settings.UPLOAD_DIR, folder))
+    except FileNotFoundError:
+        return files, folders
+    with entries:
+        for entry in entries:
+            path = f"{folder}/{entry.name}" if folder else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                folders.append(path)
+            elif entry.is_file(follow_symlinks=False):
+                files.append((path, entry.stat(follow_symlinks=False).st_mtime))
+    return files, folders
+
+def scan_uploads(workers: Optional[int] = None) -> Dict[str, float]:
+    """Upload path -> mtime for every file under UPLOAD_DIR.
+
+    Folders are listed concurrently; scandir and stat release the GIL, so
+    threads overlap the filesystem round trips on large trees.
+    """
+    found = {}
+    with ThreadPoolExecutor(max_workers=workers or settings.UPLOAD_SCAN_WORKERS) as pool:
+        pending = {pool.submit(_scan_folder, "")}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, folders = future.result()
+                found.update(files)
+                pending.update(pool.submit(_scan_folder, folder) for folder in folders)
+    return found
+
 def delete_file(file_path: str) -> bool:
+    path = upload_path(file_path)
+    if path is None:
+        return False
     try:
-        full_path = os.path.join(settings.UPLOAD_DIR, file_path)
+        full_path = os.path.join(settings.UPLOAD_DIR, path)
         if os.path.exists(full_path):
             os.remove(full_path)
             return True
         return False
     except Exception:
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,391 @@
+import asyncio
+import anyio
+import json
+import logging
+import threading
+import time
+import uuid
+from typing import Optional
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from core.config import settings
+from core.database import READ_METHODS, QueryStats, SessionLocal, current_query_stats, current_statement_timeout
+from core.profiler import Sampler, request_profiles
+from core.security import verify_token
+from models.user import User
+from core.metrics import (
+    route_template, REQUESTS_TOTAL, REQUEST_DURATION, REQUESTS_IN_PROGRESS, RESPONSE_SIZE,
+    DB_QUERIES_PER_REQUEST, DB_TIME_PER_REQUEST, DB_QUERY_BUDGET_EXCEEDED, REQUEST_TIMEOUTS,
+    ADMISSION_IN_FLIGHT, ADMISSION_QUEUED, ADMISSION_REJECTED
+)
+
+logger = logging.getLogger(__name__)
+
+def route_group(method: str, path: str) -> str:
+    """Coarse class of a request: public reads, admin writes or uploads."""
+    if "/upload/" in path:
+        return "upload"
+    if method in READ_METHODS:
+        return "read"
+    return "write"
+
+async def send_json(send, status: int, content: dict, headers: list = ()):
+    body = json.dumps(content).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())] + list(headers),
+    })
+    await send({"type": "http.response.body", "body": body})
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        response = {"status": 500, "size": 0}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response["size"] += len(message.get("body", b""))
+            await send(message)
+
+        started = time.perf_counter()
+        REQUESTS_IN_PROGRESS.inc(method=method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_PROGRESS.dec(method=method)
+            route = route_template(scope)
+            REQUEST_DURATION.observe(time.perf_counter() - started, method=method, route=route)
+            REQUESTS_TOTAL.inc(method=method, route=route, status=response["status"])
+            RESPONSE_SIZE.observe(response["size"], method=method, route=route)
+
+class QueryStatsMiddleware:
+    """Attributes SQL statements to the current request.
+
+    Adds a Server-Timing header with the statement count and DB time, feeds
+    the db_* metrics and logs requests over QUERY_BUDGET or repeating the same
+    statement N_PLUS_ONE_THRESHOLD times.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - started) * 1000
+                server_timing = (
+                    f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", '
+                    f"app;dur={total_ms:.2f}"
+                )
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"server-timing", server_timing.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_query_stats.reset(token)
+            route = route_template(scope)
+            DB_QUERIES_PER_REQUEST.observe(stats.count, route=route)
+            DB_TIME_PER_REQUEST.observe(stats.duration, route=route)
+            if stats.count > settings.QUERY_BUDGET:
+                DB_QUERY_BUDGET_EXCEEDED.inc(route=route)
+                logger.warning(
+                    "%s %s issued %d queries (budget %d) in %.1f ms",
+                    scope["method"], route, stats.count, settings.QUERY_BUDGET, stats.duration * 1000
+                )
+            for statement, count in stats.repeated_statements(settings.N_PLUS_ONE_THRESHOLD).items():
+                logger.warning(
+                    "Possible N+1 in %s %s: statement ran %d times: %s",
+                    scope["method"], route, count, statement[:200]
+                )
+
+def _is_admin_token(authorization: str) -> bool:
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        email = verify_token(token)
+    except HTTPException:
+        return False
+    db = SessionLocal()
+    try:
+        user = db.query(User).filter(User.email == email).first()
+        return bool(user and user.is_active and user.is_admin)
+    finally:
+        db.close()
+
+class ProfilingMiddleware:
+    """Samples a single request when an admin sends `X-Profile: 1`.
+
+    The event-loop thread is sampled, and so are threadpool threads while they
+    run application code, which is where plain `def` handlers execute; other
+    concurrent requests on the same worker can show up in the profile. The folded stacks are fetched from
+    /api/v1/admin/profiles/{id} using the X-Profile-Id response header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.PROFILE_REQUESTS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        if headers.get(b"x-profile") != b"1":
+            await self.app(scope, receive, send)
+            return
+        authorization = headers.get(b"authorization", b"").decode("latin-1")
+        if not await run_in_threadpool(_is_admin_token, authorization):
+            await self.app(scope, receive, send)
+            return
+
+        sampler = Sampler(settings.PROFILE_SAMPLE_INTERVAL_MS / 1000, thread_ids=[threading.get_ident()], workers=True)
+        profile_id = None
+
+        async def send_wrapper(message):
+            nonlocal profile_id
+            if message["type"] == "http.response.start":
+                sampler.stop()
+                profile_id = request_profiles.add(sampler.folded())
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if profile_id is None:
+                sampler.stop()
+
+access_logger = logging.getLogger("tmsiti.access")
+
+class AccessLogMiddleware:
+    """Emits one structured record per request through the queued log handlers."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.ACCESS_LOG_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        request_id = headers.get(b"x-request-id", b"").decode("latin-1") or uuid.uuid4().hex
+        response = {"status": 500, "size": 0}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [(b"x-request-id", request_id.encode())]
+            elif message["type"] == "http.response.body":
+                response["size"] += len(message.get("body", b""))
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            client = scope.get("client")
+            access_logger.info({
+                "event": "request",
+                "request_id": request_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route_template(scope),
+                "status": response["status"],
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+                "response_bytes": response["size"],
+                "client": client[0] if client else None,
+                "user_agent": headers.get(b"user-agent", b"").decode("latin-1"),
+            })
+
+class TimeoutMiddleware:
+    """Gives every request a deadline by route group and answers 504 past it.
+
+    The 504 goes out at the deadline, but the request is only cancelled at
+    its next await. Database handlers are plain functions run in the
+    threadpool, so a slow query keeps the event loop free and runs on after
+    the 504; the middleware returns (releasing the session and admission
+    slot) once it finishes. What bounds query time is the matching
+    PostgreSQL statement_timeout handed to get_db: the statement is
+    cancelled server-side and releases its pooled connection, which
+    surfaces as 503 through the exception handler in main.py when it beats
+    the deadline. Other backends have no such bound.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        group = route_group(scope["method"], scope["path"])
+        timeout = {
+            "read": settings.READ_REQUEST_TIMEOUT_SECONDS,
+            "write": settings.WRITE_REQUEST_TIMEOUT_SECONDS,
+            "upload": settings.UPLOAD_REQUEST_TIMEOUT_SECONDS,
+        }[group]
+        statement_timeout_ms = settings.READ_STATEMENT_TIMEOUT_MS if group == "read" else settings.WRITE_STATEMENT_TIMEOUT_MS
+        if timeout > 0:
+            # A statement may not outlive the request it belongs to
+            statement_timeout_ms = min(statement_timeout_ms or int(timeout * 1000), int(timeout * 1000))
+        token = current_statement_timeout.set(statement_timeout_ms or None)
+
+        response_started = False
+        timed_out = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if timed_out:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            if timeout <= 0:
+                await self.app(scope, receive, send_wrapper)
+                return
+            # An anyio cancel scope rather than asyncio.wait_for: threadpool
+            # calls shield themselves from it, so get_db's session is never
+            # closed under a handler that is still running
+            app_scope = anyio.CancelScope()
+            done = anyio.Event()
+            error = None
+
+            async def run_app():
+                nonlocal error
+                try:
+                    with app_scope:
+                        await self.app(scope, receive, send_wrapper)
+                except Exception as exc:
+                    error = exc
+                finally:
+                    done.set()
+
+            async with anyio.create_task_group() as task_group:
+                task_group.start_soon(run_app)
+                with anyio.move_on_after(timeout):
+                    await done.wait()
+                if not done.is_set():
+                    REQUEST_TIMEOUTS.inc(route=route_template(scope), kind="deadline")
+                    timed_out = True
+                    if not response_started:
+                        await send_json(send, 504, {"detail": "Request timed out"})
+                    app_scope.cancel()
+            if error is not None:
+                raise error
+            if timed_out and response_started:
+                raise asyncio.TimeoutError()
+        finally:
+            current_statement_timeout.reset(token)
+
+class AdmissionLimiter:
+    """Concurrency limit with a bounded, time-limited wait queue."""
+
+    def __init__(self, group: str, limit: int, queue_size: int, queue_timeout: float):
+        self.group = group
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def acquire(self) -> Optional[str]:
+        """Returns None once admitted, otherwise the reason for rejection."""
+        if self.in_flight < self.limit and not self.waiting:
+            await self._semaphore.acquire()
+        else:
+            if self.waiting >= self.queue_size:
+                return "queue_full"
+            self.waiting += 1
+            ADMISSION_QUEUED.inc(group=self.group)
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except asyncio.TimeoutError:
+                return "queue_timeout"
+            finally:
+                self.waiting -= 1
+                ADMISSION_QUEUED.dec(group=self.group)
+        self.in_flight += 1
+        ADMISSION_IN_FLIGHT.inc(group=self.group)
+        return None
+
+    def release(self):
+        self.in_flight -= 1
+        ADMISSION_IN_FLIGHT.dec(group=self.group)
+        self._semaphore.release()
+
+class AdmissionControlMiddleware:
+    """Sheds load instead of letting requests pile up on the database pool.
+
+    Each route group (public reads, admin writes, uploads) admits a fixed
+    number of concurrent requests plus a bounded queue; anything beyond that,
+    or waiting longer than ADMISSION_QUEUE_TIMEOUT_SECONDS, gets an immediate
+    503 with Retry-After. Health and metrics endpoints and OPTIONS requests
+    (CORS preflights) are never shed.
+    """
+
+    EXEMPT_PREFIXES = ("/health", "/metrics")
+    EXEMPT_METHODS = ("OPTIONS",)
+
+    def __init__(self, app):
+        self.app = app
+        self.limiters = {}
+        for group, limit, queue_size in (
+            ("read", settings.READ_CONCURRENCY_LIMIT, settings.READ_QUEUE_SIZE),
+            ("write", settings.WRITE_CONCURRENCY_LIMIT, settings.WRITE_QUEUE_SIZE),
+            ("upload", settings.UPLOAD_CONCURRENCY_LIMIT, settings.UPLOAD_QUEUE_SIZE),
+        ):
+            if limit > 0:
+                self.limiters[group] = AdmissionLimiter(group, limit, queue_size, settings.ADMISSION_QUEUE_TIMEOUT_SECONDS)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http" or scope["path"].startswith(self.EXEMPT_PREFIXES)
+            or scope["method"] in self.EXEMPT_METHODS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.limiters.get(route_group(scope["method"], scope["path"]))
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        rejection = await limiter.acquire()
+        if rejection is not None:
+            ADMISSION_REJECTED.inc(group=limiter.group, reason=rejection)
+            await send_json(
+                send, 503, {"detail": "Server is busy, please retry"},
+                [(b"retry-after", str(settings.ADMISSION_RETRY_AFTER_SECONDS).encode())]
+            )
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
@@ -0,0 +1,81 @@
+import json
+from typing import Dict, Optional, Tuple
+from core.i18n import DEFAULT_LOCALE, TRANSLATION_LOCALES, localized_values
+from core.memory_index import MemoryIndex
+from models.regulatory import ConstructionNorm, natural_sort_key
+
+NORM_FIELDS = ("id", "code", "link")
+
+class ConstructionNormTree(MemoryIndex):
+    """subsystem -> group -> norms, as served by /construction-norms/tree.
+
+    Norms keep their title in every locale; each locale renders separately.
+    """
+
+    models = (ConstructionNorm,)
+
+    def __init__(self):
+        super().__init__()
+        self._groups: Dict[Tuple[str, str], Dict[int, dict]] = {}
+        self._positions: Dict[int, Tuple[str, str]] = {}
+        self._rendered: Dict[Tuple[bool, str], bytes] = {}
+
+    def rebuild(self, db):
+        rows = db.query(
+            ConstructionNorm.id, ConstructionNorm.subsystem, ConstructionNorm.group,
+            ConstructionNorm.code, ConstructionNorm.title, ConstructionNorm.link,
+            *(getattr(ConstructionNorm, f"title_{locale}") for locale in TRANSLATION_LOCALES)
+        ).all()
+        self._groups = {}
+        self._positions = {}
+        for row in rows:
+            self._add(row._asdict())
+        self._rendered = {}
+
+    def apply(self, action, model, row, old):
+        if old is not None:
+            self._remove(old["id"])
+        if row is not None:
+            self._add(row)
+        self._rendered = {}
+
+    def _add(self, row: dict):
+        position = (row["subsystem"], row["group"])
+        norm = {field: row[field] for field in NORM_FIELDS}
+        norm["titles"] = localized_values(ConstructionNorm, row, "title")
+        self._groups.setdefault(position, {})[row["id"]] = norm
+        self._positions[row["id"]] = position
+
+    def _remove(self, norm_id: int):
+        position = self._positions.pop(norm_id, None)
+        if position is None:
+            return
+        group = self._groups[position]
+        group.pop(norm_id, None)
+        if not group:
+            del self._groups[position]
+
+    def render(self, include_norms: bool = True, locale: str = DEFAULT_LOCALE) -> bytes:
+        with self._lock:
+            cached: Optional[bytes] = self._rendered.get((include_norms, locale))
+            if cached is not None:
+                return cached
+            subsystems = []
+            for subsystem, group_name in sorted(self._groups):
+                norms = self._groups[(subsystem, group_name)]
+                if not subsystems or subsystems[-1]["name"] != subsystem:
+                    subsystems.append({"name": subsystem, "count": 0, "groups": []})
+                group = {"name": group_name, "count": len(norms)}
+                if include_norms:
+                    group["norms"] = [
+                        {"id": norm["id"], "code": norm["code"], "title": norm["titles"][locale], "link": norm["link"]}
+                        for norm in sorted(norms.values(), key=lambda norm: (natural_sort_key(norm["code"]), norm["code"]))
+                    ]
+                subsystems[-1]["groups"].append(group)
+                subsystems[-1]["count"] += len(norms)
+            tree = {"total": len(self._positions), "subsystems": subsystems}
+            rendered = json.dumps(tree, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            self._rendered[(include_norms, locale)] = rendered
+            return rendered
+
+norm_tree = ConstructionNormTree()
@@ -1,11 +1,14 @@
-from typing import List, Generic, TypeVar
+from typing import List, Generic, Optional, TypeVar
 from sqlalchemy.orm import Query
 from schemas.common import PaginatedResponse
+from core.i18n import DEFAULT_LOCALE, base_column_names, is_translated, localized_columns
 from math import ceil
 
 T = TypeVar('T')
 
-def paginate(query: Query, page: int = 1, size: int = 10) -> PaginatedResponse[T]:
+def paginate(
+    query: Query, page: int = 1, size: int = 10, fields: Optional[List[str]] = None, locale: str = DEFAULT_LOCALE
+) -> PaginatedResponse[T]:
     if page < 1:
         page = 1
     if size < 1:
@@ -14,7 +17,17 @@ def paginate(query: Query, page: int = 1, size: int = 10) -> PaginatedResponse[T
         size = 100
     
     total = query.count()
+    entity = query.column_descriptions[0]["entity"]
+    if not fields and is_translated(entity):
+        # Never load the other locales' columns
+        fields = base_column_names(entity)
+    if fields:
+        # Only SELECT the requested columns and hand back plain dicts,
+        # so large Text columns never leave the database for list pages
+        query = query.with_entities(*localized_columns(entity, locale, fields))
     items = query.offset((page - 1) * size).limit(size).all()
+    if fields:
+        items = [dict(row._mapping) for row in items]
     pages = ceil(total / size)
     
     return PaginatedResponse(
@@ -23,4 +36,4 @@ def paginate(query: Query, page: int = 1, size: int = 10) -> PaginatedResponse[T
         page=page,
         size=size,
         pages=pages
-    )
\ No newline at end of file
+    )
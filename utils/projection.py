@@ -0,0 +1,29 @@
+from typing import List, Optional, Sequence
+from fastapi import HTTPException
+from core.i18n import base_column_names
+
+def get_column_names(model) -> List[str]:
+    # Translations are selected through the locale, never by name
+    return base_column_names(model)
+
+def parse_fields(fields: Optional[str], model, default: Sequence[str]) -> List[str]:
+    """Resolve a `?fields=a,b,c` query value into a list of column names.
+
+    Falls back to `default` when nothing is requested and accepts `*` for
+    every column. `id` is always returned so clients can link to the detail.
+    """
+    columns = get_column_names(model)
+    if not fields:
+        selected = list(default)
+    elif fields.strip() == "*":
+        selected = list(columns)
+    else:
+        selected = [name.strip() for name in fields.split(",") if name.strip()]
+
+    unknown = [name for name in selected if name not in columns]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+
+    if "id" not in selected:
+        selected.insert(0, "id")
+    return list(dict.fromkeys(selected))
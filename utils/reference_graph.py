@@ -0,0 +1,194 @@
+import re
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+from core.i18n import DEFAULT_LOCALE, TRANSLATION_LOCALES, localized_values
+from core.memory_index import MemoryIndex
+from models.regulatory import (
+    ConstructionNorm, Standard, BuildingRegulation, CostResourceNorm, TechnicalRegulation, shnq_links
+)
+
+# URL segment -> model, matching the list endpoints in api/regulatory.py
+KINDS = {
+    "construction-norms": ConstructionNorm,
+    "standards": Standard,
+    "building-regulations": BuildingRegulation,
+    "cost-resource-norms": CostResourceNorm,
+    "technical-regulations": TechnicalRegulation,
+}
+MODEL_KINDS = {model: kind for kind, model in KINDS.items()}
+
+TEXT_FIELDS = ("title", "srn_title", "description")
+
+# The dotted/dashed number inside a code ("1.01.01-2000", "1000:2000");
+# candidate mentions in free text are found by it and then confirmed
+CODE_CORE = re.compile(r"\d+(?:[.:/-]\d+)+")
+
+Node = Tuple[str, int]
+
+def normalize_code(code: str) -> str:
+    return " ".join(re.sub(r"[ʻʼ‘’`]", "'", code).casefold().split())
+
+class ReferenceGraph(MemoryIndex):
+    """Which regulatory documents cite which, by code.
+
+    Cost resource norms cite their ShNQ codes explicitly; any document also
+    cites the codes its title/description mention. Edges are stored by
+    target code and resolved on read, so an explicit reference to a document
+    created later resolves at once. Mentions are only recognised for codes
+    known when the text is indexed, until the next full rebuild.
+    """
+
+    models = tuple(KINDS.values())
+
+    def __init__(self):
+        super().__init__()
+        self._nodes: Dict[Node, dict] = {}
+        self._code_nodes: Dict[str, Set[Node]] = {}
+        self._core_codes: Dict[str, Set[str]] = {}
+        self._references: Dict[Node, Dict[str, str]] = {}
+        self._referrers: Dict[str, Set[Node]] = {}
+
+    def rebuild(self, db):
+        self._nodes, self._code_nodes, self._core_codes = {}, {}, {}
+        self._references, self._referrers = {}, {}
+        rows = []
+        for model in self.models:
+            columns = [
+                getattr(model, column.key) for column in model.__table__.columns
+                if column.key not in ("created_at", "updated_at", "deleted_at")
+            ]
+            rows.extend((model, row._asdict()) for row in db.query(*columns))
+        # Codes first, so mentions of any document can be recognised
+        for model, row in rows:
+            self._add_node(model, row)
+        for model, row in rows:
+            self._add_references(model, row)
+
+    def apply(self, action, model, row, old):
+        if old is not None:
+            self._remove(model, old)
+        if row is not None:
+            self._add_node(model, row)
+            self._add_references(model, row)
+
+    def _code(self, model, row: dict) -> str:
+        return row["srn_code"] if model is CostResourceNorm else row["code"]
+
+    def _add_node(self, model, row: dict):
+        node = (MODEL_KINDS[model], row["id"])
+        code = self._code(model, row)
+        titles = localized_values(model, row, "srn_title" if model is CostResourceNorm else "title")
+        self._nodes[node] = {"kind": node[0], "id": row["id"], "code": code, "titles": titles}
+        normalized = normalize_code(code)
+        self._code_nodes.setdefault(normalized, set()).add(node)
+        for core in CODE_CORE.findall(normalized):
+            self._core_codes.setdefault(core, set()).add(normalized)
+
+    def _mentions(self, text: str) -> Set[str]:
+        text = normalize_code(text)
+        found = set()
+        for core in set(CODE_CORE.findall(text)):
+            matches = {code for code in self._core_codes.get(core, ()) if code in text}
+            # "KMK ShNQ 1.01.01-2000" mentions that code, not also "ShNQ 1.01.01-2000"
+            found.update(code for code in matches if not any(code != other and code in other for other in matches))
+        return found
+
+    def _add_references(self, model, row: dict):
+        node = (MODEL_KINDS[model], row["id"])
+        references: Dict[str, str] = {}
+        if model is CostResourceNorm:
+            for link in shnq_links(row["main_shnq_code"], row["main_shnq_title"], row["additional_shnqs"]):
+                references[normalize_code(link["shnq_code"])] = link["shnq_code"]
+        # Translations can mention codes too
+        names = [name for field in TEXT_FIELDS for name in (field, *(f"{field}_{locale}" for locale in TRANSLATION_LOCALES))]
+        text = " ".join(row[name] for name in names if row.get(name))
+        for code in self._mentions(text):
+            references.setdefault(code, code)
+        references.pop(normalize_code(self._code(model, row)), None)
+        self._references[node] = references
+        for code in references:
+            self._referrers.setdefault(code, set()).add(node)
+
+    def _remove(self, model, old: dict):
+        node = (MODEL_KINDS[model], old["id"])
+        info = self._nodes.pop(node, None)
+        if info is not None:
+            normalized = normalize_code(info["code"])
+            nodes = self._code_nodes.get(normalized, set())
+            nodes.discard(node)
+            if not nodes:
+                self._code_nodes.pop(normalized, None)
+                for core in CODE_CORE.findall(normalized):
+                    self._core_codes.get(core, set()).discard(normalized)
+        for code in self._references.pop(node, {}):
+            referrers = self._referrers.get(code, set())
+            referrers.discard(node)
+            if not referrers:
+                self._referrers.pop(code, None)
+
+    def _public(self, node: Node, locale: str) -> dict:
+        info = self._nodes[node]
+        return {"kind": info["kind"], "id": info["id"], "code": info["code"], "title": info["titles"][locale]}
+
+    def node(self, kind: str, doc_id: int, locale: str = DEFAULT_LOCALE) -> Optional[dict]:
+        with self._lock:
+            if (kind, doc_id) not in self._nodes:
+                return None
+            return self._public((kind, doc_id), locale)
+
+    def references(self, kind: str, doc_id: int, locale: str = DEFAULT_LOCALE) -> Tuple[List[dict], List[str]]:
+        with self._lock:
+            resolved, unresolved = [], []
+            for code, display in self._references.get((kind, doc_id), {}).items():
+                targets = self._code_nodes.get(code)
+                if targets:
+                    resolved.extend(self._public(target, locale) for target in targets)
+                else:
+                    unresolved.append(display)
+            return sorted(resolved, key=_order), sorted(unresolved)
+
+    def referenced_by(self, kind: str, doc_id: int, locale: str = DEFAULT_LOCALE) -> List[dict]:
+        with self._lock:
+            return sorted(
+                (self._public(node, locale) for node in self._referrer_nodes((kind, doc_id))), key=_order
+            )
+
+    def _referrer_nodes(self, node: Node) -> Set[Node]:
+        info = self._nodes.get(node)
+        if info is None:
+            return set()
+        return self._referrers.get(normalize_code(info["code"]), set()) - {node}
+
+    def _reference_nodes(self, node: Node) -> Set[Node]:
+        targets = set()
+        for code in self._references.get(node, {}):
+            targets.update(self._code_nodes.get(code, ()))
+        return targets - {node}
+
+    def dependencies(
+        self, kind: str, doc_id: int, reverse: bool = False, max_depth: int = 10, locale: str = DEFAULT_LOCALE
+    ) -> List[dict]:
+        """Everything reachable within max_depth hops, each with the hop count it was first reached at."""
+        step = self._referrer_nodes if reverse else self._reference_nodes
+        with self._lock:
+            start = (kind, doc_id)
+            depths = {start: 0}
+            queue = deque([start])
+            while queue:
+                node = queue.popleft()
+                if depths[node] == max_depth:
+                    continue
+                for target in step(node):
+                    if target not in depths:
+                        depths[target] = depths[node] + 1
+                        queue.append(target)
+            del depths[start]
+            return sorted(
+                (dict(self._public(node, locale), depth=depth) for node, depth in depths.items()),
+                key=lambda item: (item["depth"],) + _order(item)
+            )
+
+def _order(node: dict):
+    return (node["kind"], node["code"], node["id"])
+
+reference_graph = ReferenceGraph()
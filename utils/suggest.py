@@ -0,0 +1,129 @@
+import re
+from bisect import bisect_left, insort
+from typing import Dict, List, Tuple
+from core.i18n import DEFAULT_LOCALE, TRANSLATION_LOCALES, localized_values
+from core.memory_index import MemoryIndex
+from models.regulatory import (
+    ConstructionNorm, Standard, BuildingRegulation, CostResourceNorm, TechnicalRegulation, Reference
+)
+from utils.reference_graph import KINDS, normalize_code
+
+SUGGEST_KINDS = dict(KINDS, references=Reference)
+SUGGEST_MODEL_KINDS = {model: kind for kind, model in SUGGEST_KINDS.items()}
+
+# (code column, extra code-like columns, title column)
+FIELDS = {
+    ConstructionNorm: ("code", (), "title"),
+    Standard: ("code", (), "title"),
+    BuildingRegulation: ("code", ("number",), "title"),
+    CostResourceNorm: ("srn_code", ("main_shnq_code",), "srn_title"),
+    TechnicalRegulation: ("code", (), "title"),
+    Reference: ("number", (), "title"),
+}
+
+TOKEN = re.compile(r"[\w']{2,}")
+
+Entry = Tuple[str, str, int]
+
+class SuggestIndex(MemoryIndex):
+    """Sorted (key, kind, id) arrays searched by prefix with bisect.
+
+    Codes are keyed in full and from every word on ("shnq 1.01.01-2000"
+    also finds "KMK ShNQ 1.01.01-2000"); titles by each word, in every
+    locale, and are returned in the one asked for.
+    """
+
+    models = tuple(FIELDS)
+
+    def __init__(self):
+        super().__init__()
+        self._codes: List[Entry] = []
+        self._tokens: List[Entry] = []
+        self._docs: Dict[Tuple[str, int], dict] = {}
+        self._entries: Dict[Tuple[str, int], Tuple[List[Entry], List[Entry]]] = {}
+
+    def rebuild(self, db):
+        self._docs, self._entries = {}, {}
+        codes, tokens = [], []
+        for model, (code_field, extra_fields, title_field) in FIELDS.items():
+            translations = tuple(f"{title_field}_{locale}" for locale in TRANSLATION_LOCALES)
+            columns = [getattr(model, field) for field in ("id", code_field, title_field) + translations + extra_fields]
+            for row in db.query(*columns):
+                code_entries, token_entries = self._add_doc(model, row._asdict())
+                codes.extend(code_entries)
+                tokens.extend(token_entries)
+        self._codes = sorted(codes)
+        self._tokens = sorted(tokens)
+
+    def apply(self, action, model, row, old):
+        if old is not None:
+            self._remove((SUGGEST_MODEL_KINDS[model], old["id"]))
+        if row is not None:
+            code_entries, token_entries = self._add_doc(model, row)
+            for entry in code_entries:
+                insort(self._codes, entry)
+            for entry in token_entries:
+                insort(self._tokens, entry)
+
+    def _add_doc(self, model, row: dict):
+        code_field, extra_fields, title_field = FIELDS[model]
+        kind = SUGGEST_MODEL_KINDS[model]
+        node = (kind, row["id"])
+        titles = {locale: title or "" for locale, title in localized_values(model, row, title_field).items()}
+        title_words = set(TOKEN.findall(normalize_code(" ".join(set(titles.values())))))
+        self._docs[node] = {"kind": kind, "id": row["id"], "code": row[code_field], "titles": titles, "words": title_words}
+        code_keys = set()
+        for value in (row[code_field],) + tuple(row[field] for field in extra_fields):
+            words = normalize_code(value or "").split()
+            code_keys.update(" ".join(words[start:]) for start in range(len(words)))
+        entries = (
+            [(key, kind, row["id"]) for key in code_keys],
+            [(key, kind, row["id"]) for key in title_words],
+        )
+        self._entries[node] = entries
+        return entries
+
+    def _remove(self, node):
+        self._docs.pop(node, None)
+        code_entries, token_entries = self._entries.pop(node, ([], []))
+        for array, entries in ((self._codes, code_entries), (self._tokens, token_entries)):
+            for entry in entries:
+                position = bisect_left(array, entry)
+                if position < len(array) and array[position] == entry:
+                    del array[position]
+
+    def suggest(self, query: str, limit: int = 10, locale: str = DEFAULT_LOCALE) -> List[dict]:
+        query = normalize_code(query)
+        if not query:
+            # Blank once normalized: every key would match the empty prefix
+            return []
+        words = TOKEN.findall(query)
+        results, seen = [], set()
+        with self._lock:
+            # Code matches rank first; within a pass keys come out in
+            # order, so an exact match precedes longer ones
+            self._collect(self._codes, query, "code", limit, locale, results, seen)
+            if words:
+                self._collect(self._tokens, words[-1], "title", limit, locale, results, seen, words[:-1])
+        return results
+
+    def _collect(self, array, prefix, match, limit, locale, results, seen, other_words=()):
+        position = bisect_left(array, (prefix,))
+        while position < len(array) and len(results) < limit:
+            key, kind, doc_id = array[position]
+            if not key.startswith(prefix):
+                break
+            position += 1
+            node = (kind, doc_id)
+            if node in seen:
+                continue
+            doc = self._docs[node]
+            if other_words:
+                if not all(any(word.startswith(other) for word in doc["words"]) for other in other_words):
+                    continue
+            seen.add(node)
+            results.append({
+                "kind": kind, "id": doc_id, "code": doc["code"], "title": doc["titles"][locale], "match": match
+            })
+
+suggest_index = SuggestIndex()